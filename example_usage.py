@@ -11,6 +11,7 @@ MechDrawKit 使用示例
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import ezdxf
 # 新的推荐导入方式
 from mechdrawkit import (
@@ -114,34 +115,28 @@ def demo_new_architecture():
     print(f"  ✓ 保存文件: {output_path}")
 
 
-def demo_template_system():
-    """演示3：模板系统 - 使用预定义模板"""
-    print("\n" + "=" * 60)
-    print("演示3：模板系统")
-    print("=" * 60)
-    
-    # 轴类零件模板
-    print("  ✓ 使用轴类零件模板")
-    doc1 = ezdxf.new('R2010')
-    msp1 = doc1.modelspace()
+def render_shaft_template(output_path):
+    """使用轴类零件模板生成图纸并保存（供进程池调用，需为模块级函数）"""
+    doc = ezdxf.new('R2010')
+    msp = doc.modelspace()
     
-    shaft_template = ShaftTemplate(msp1, doc1)
+    shaft_template = ShaftTemplate(msp, doc)
     shaft_doc = shaft_template.generate_drawing(
         origin=(150, 150),
         diameter=30,
         length=120
     )
     
-    output_path1 = "output/demo3_shaft_template.dxf"
-    shaft_doc.saveas(output_path1)
-    print(f"    保存轴类零件图: {output_path1}")
-    
-    # 齿轮零件模板
-    print("  ✓ 使用齿轮零件模板")
-    doc2 = ezdxf.new('R2010')
-    msp2 = doc2.modelspace()
+    shaft_doc.saveas(output_path)
+    return output_path
+
+
+def render_gear_template(output_path):
+    """使用齿轮零件模板生成图纸并保存（供进程池调用，需为模块级函数）"""
+    doc = ezdxf.new('R2010')
+    msp = doc.modelspace()
     
-    gear_template = GearTemplate(msp2, doc2)
+    gear_template = GearTemplate(msp, doc)
     gear_doc = gear_template.generate_drawing(
         origin=(150, 150),
         outer_diameter=80,
@@ -149,9 +144,30 @@ def demo_template_system():
         thickness=12
     )
     
-    output_path2 = "output/demo3_gear_template.dxf"
-    gear_doc.saveas(output_path2)
-    print(f"    保存齿轮零件图: {output_path2}")
+    gear_doc.saveas(output_path)
+    return output_path
+
+
+def demo_template_system():
+    """演示3：模板系统 - 使用预定义模板
+    
+    各模板输出相互独立的文件，在进程池中并行生成
+    """
+    print("\n" + "=" * 60)
+    print("演示3：模板系统")
+    print("=" * 60)
+    
+    jobs = {
+        render_shaft_template: ("轴类零件", "output/demo3_shaft_template.dxf"),
+        render_gear_template: ("齿轮零件", "output/demo3_gear_template.dxf"),
+    }
+    for label, _ in jobs.values():
+        print(f"  ✓ 使用{label}模板")
+    
+    with ProcessPoolExecutor() as executor:
+        futures = {executor.submit(render, path): label for render, (label, path) in jobs.items()}
+        for future in as_completed(futures):
+            print(f"    保存{futures[future]}图: {future.result()}")
 
 
 def demo_mixed_usage():
@@ -10,21 +10,17 @@ from .config.gb_standards import GBStandardConfig
 from .core.adapters import EzdxfAdapter
 from .core.factory import ComponentFactory
 
-# 导入策略组件
+# 导入策略组件（具体策略在首次访问时导入）
 from .core.strategies.base import DrawingStrategy
-from .core.strategies.basic_shapes import BasicShapeDrawer
-from .core.strategies.dimensions import DimensionDrawer
-from .core.strategies.symbols import SymbolDrawer
-from .core.strategies.views import ViewDrawer
 
 # 导入模板系统
 from .core.templates import DrawingTemplate, ShaftTemplate, GearTemplate
 
 # 导入主要绘图工具
-from .drawing_tools import RiceMillDrawingTools, generate_part_drawing, find_project_root
+from .drawing_tools import RiceMillDrawingTools, generate_part_drawing, generate_part_drawings_many, find_project_root, memoizable
 
 # 导入工具函数
-from .tools import update_title_block, add_parts_table, add_part_to_table
+from .tools import update_title_block, add_parts_table, add_part_to_table, save_all
 
 # 主要的公共API
 __all__ = [
@@ -52,10 +48,32 @@ __all__ = [
     # 主要绘图工具
     'RiceMillDrawingTools',
     'generate_part_drawing',
+    'generate_part_drawings_many',
     'find_project_root',
+    'memoizable',
     
     # 工具函数
     'update_title_block',
     'add_parts_table',
     'add_part_to_table',
-] 
\ No newline at end of file
+    'save_all',
+] 
+
+
+# 具体策略组件的懒加载映射
+_LAZY_STRATEGIES = {
+    'BasicShapeDrawer': '.core.strategies.basic_shapes',
+    'DimensionDrawer': '.core.strategies.dimensions',
+    'SymbolDrawer': '.core.strategies.symbols',
+    'ViewDrawer': '.core.strategies.views',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_STRATEGIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -1,54 +1,89 @@
+import itertools
 import json
 import os
+import sys
 from typing import Dict, Any, Optional
 
 
+# 默认配置文件路径
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gb_standards.json')
+
+# 默认标准比例
+DEFAULT_SCALES = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+
+
+def _load_config(config_file: str) -> Dict[str, Any]:
+    """加载配置文件"""
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        return config
+    except FileNotFoundError:
+        raise FileNotFoundError(f"配置文件未找到: {config_file}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"配置文件格式错误: {e}")
+
+
+def _intern_layer_mapping(mapping: Dict[str, str]) -> Dict[str, str]:
+    """驻留图层名称字符串，使其作为属性字典值和缓存键时共享同一对象"""
+    return {sys.intern(k): sys.intern(v) for k, v in mapping.items()}
+
+
+# 配置版本号，每次应用配置时取下一个值，供使用方判断配置是否已重新加载
+_CONFIG_VERSIONS = itertools.count(1)
+
+
 class GBStandardConfig:
-    """GB标准配置管理类 - 单例模式"""
+    """GB标准配置管理类 - 单例模式
+    
+    首次构造时加载配置，之后的构造都返回同一实例并忽略 config_file；
+    更换配置文件请调用 reload_config
+    """
+    
+    __slots__ = ('_config', '_line_types', '_layer_mapping', '_line_weights', '_text_heights', '_version')
     
     _instance: Optional['GBStandardConfig'] = None
-    _config: Optional[Dict[str, Any]] = None
     
     def __new__(cls, config_file: str = None):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    def __init__(self, config_file: str = None):
-        if self._config is None:
-            if config_file is None:
-                # 默认配置文件路径
-                current_dir = os.path.dirname(os.path.abspath(__file__))
-                config_file = os.path.join(current_dir, 'gb_standards.json')
-            
-            self._config = self._load_config(config_file)
+        instance = cls._instance
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.reload_config(config_file)
+            cls._instance = instance
+        return instance
     
     def _load_config(self, config_file: str) -> Dict[str, Any]:
         """加载配置文件"""
-        try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            return config
-        except FileNotFoundError:
-            raise FileNotFoundError(f"配置文件未找到: {config_file}")
-        except json.JSONDecodeError as e:
-            raise ValueError(f"配置文件格式错误: {e}")
+        return _load_config(config_file)
+    
+    def _apply_config(self, config: Dict[str, Any]):
+        """保存配置，并展开为一级查找表"""
+        self._config = config
+        self._line_types = config.get('line_types', {})
+        self._layer_mapping = _intern_layer_mapping(config.get('layer_mapping', {}))
+        self._line_weights = config.get('line_weights', {})
+        self._text_heights = config.get('text_heights', {})
+        self._version = next(_CONFIG_VERSIONS)
+    
+    def get_version(self) -> int:
+        """获取配置版本号，每次加载配置后变化"""
+        return self._version
     
     def get_line_type(self, line_type: str) -> Optional[Dict[str, Any]]:
         """获取线型配置"""
-        return self._config.get('line_types', {}).get(line_type)
+        return self._line_types.get(line_type)
     
     def get_layer_mapping(self, logical_layer: str) -> str:
         """获取图层映射"""
-        return self._config.get('layer_mapping', {}).get(logical_layer, logical_layer)
+        return self._layer_mapping.get(logical_layer, logical_layer)
     
     def get_line_weight(self, weight_type: str) -> Optional[float]:
         """获取线宽配置"""
-        return self._config.get('line_weights', {}).get(weight_type)
+        return self._line_weights.get(weight_type)
     
     def get_text_height(self, height_type: str) -> Optional[float]:
         """获取文字高度配置"""
-        return self._config.get('text_heights', {}).get(height_type)
+        return self._text_heights.get(height_type)
     
     def get_arrow_size(self) -> float:
         """获取箭头尺寸"""
@@ -60,20 +95,19 @@ class GBStandardConfig:
     
     def get_scales(self) -> list:
         """获取标准比例列表"""
-        return self._config.get('scales', [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000])
+        return self._config.get('scales', DEFAULT_SCALES)
     
     def get_all_line_types(self) -> Dict[str, Dict[str, Any]]:
         """获取所有线型配置"""
-        return self._config.get('line_types', {})
+        return self._line_types
     
     def get_all_layer_mappings(self) -> Dict[str, str]:
         """获取所有图层映射"""
-        return self._config.get('layer_mapping', {})
+        return self._layer_mapping
     
     def reload_config(self, config_file: str = None):
         """重新加载配置文件"""
         if config_file is None:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            config_file = os.path.join(current_dir, 'gb_standards.json')
+            config_file = DEFAULT_CONFIG_FILE
         
-        self._config = self._load_config(config_file) 
\ No newline at end of file
+        self._apply_config(self._load_config(config_file))
\ No newline at end of file
@@ -0,0 +1,79 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba为可选依赖，未安装时退化为普通numpy函数
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def rect_corners(x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray) -> np.ndarray:
+    """批量计算矩形四个角点
+    
+    Args:
+        x, y: (N,) 左下角坐标数组
+        width: (N,) 宽度数组
+        height: (N,) 高度数组
+        
+    Returns:
+        (N, 4, 2) 数组，每个矩形按逆时针顺序：左下、右下、右上、左上
+    """
+    corners = np.empty((x.shape[0], 4, 2))
+    corners[:, 0, 0] = x
+    corners[:, 0, 1] = y
+    corners[:, 1, 0] = x + width
+    corners[:, 1, 1] = y
+    corners[:, 2, 0] = x + width
+    corners[:, 2, 1] = y + height
+    corners[:, 3, 0] = x
+    corners[:, 3, 1] = y + height
+    return corners
+
+
+@njit(cache=True)
+def shaft_layout(parts: np.ndarray):
+    """批量计算轴零件图的视图几何，与 ShaftTemplate 单件绘制的坐标一致
+    
+    Args:
+        parts: (N, 4) 数组，每行为 (原点x, 原点y, 直径, 长度)
+        
+    Returns:
+        rects: (N, 4, 2) 主视图外轮廓角点
+        circles: (N, 3) 左视图圆 (圆心x, 圆心y, 半径)
+        centerlines: (N, 3, 2, 2) 主视图中心线及左视图的水平、竖直中心线
+    """
+    n = parts.shape[0]
+    x = parts[:, 0]
+    y = parts[:, 1]
+    diameter = parts[:, 2]
+    length = parts[:, 3]
+    hd = diameter * 0.5
+    hl = length * 0.5
+    
+    # 主视图外轮廓
+    rects = rect_corners(x - hl, y - hd, length, diameter)
+    
+    # 左视图位于原点左侧80处
+    view_x = x - 80.0
+    circles = np.empty((n, 3))
+    circles[:, 0] = view_x
+    circles[:, 1] = y
+    circles[:, 2] = hd
+    
+    centerlines = np.empty((n, 3, 2, 2))
+    centerlines[:, 0, 0, 0] = x - (hl + 10.0)
+    centerlines[:, 0, 0, 1] = y
+    centerlines[:, 0, 1, 0] = x + (hl + 10.0)
+    centerlines[:, 0, 1, 1] = y
+    centerlines[:, 1, 0, 0] = x + (-80.0 - hd - 5.0)
+    centerlines[:, 1, 0, 1] = y
+    centerlines[:, 1, 1, 0] = x + (-80.0 + hd + 5.0)
+    centerlines[:, 1, 1, 1] = y
+    centerlines[:, 2, 0, 0] = view_x
+    centerlines[:, 2, 0, 1] = y - (hd + 5.0)
+    centerlines[:, 2, 1, 0] = view_x
+    centerlines[:, 2, 1, 1] = y + (hd + 5.0)
+    return rects, circles, centerlines
\ No newline at end of file
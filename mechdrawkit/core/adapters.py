@@ -1,14 +1,47 @@
+import itertools
+import weakref
+from types import MappingProxyType
 import ezdxf
-from typing import Any, Tuple, List, Optional, Dict
+import numpy as np
+from ezdxf.entities import Line, Point
+from typing import Any, Tuple, List, Optional, Dict, Iterable
 from ..config.gb_standards import GBStandardConfig
 
 
+# 图层线型推断规则，按优先级排列：(线型, 图层名称片段, 逻辑图层集合)
+# 图层名称包含片段或逻辑图层属于集合时采用该线型，均不满足时检查下一条
+_LINETYPE_RULES = (
+    ('CENTER', '中心线', frozenset(('CENTERLINE', 'AXIS'))),
+    ('HIDDEN', '虚线', frozenset(('HIDDEN',))),
+    ('PHANTOM', '双点长划线', frozenset(('PHANTOM',))),
+    ('BORDER', '边界线', frozenset(('BORDER',))),
+)
+
+
+def _infer_linetype(logical_layer: str, mapped_name: str) -> str:
+    """根据图层名称和逻辑图层推断线型，无匹配时为 CONTINUOUS"""
+    for linetype, fragment, logical_layers in _LINETYPE_RULES:
+        if fragment in mapped_name or logical_layer in logical_layers:
+            return linetype
+    return 'CONTINUOUS'
+
+
+# 未指定标注样式覆盖时共用的只读空映射
+_EMPTY_OVERRIDE = MappingProxyType({})
+
+
 class EzdxfAdapter:
     """ezdxf适配器类
     
     封装ezdxf的ModelSpace操作，自动应用GB标准配置
     """
     
+    __slots__ = ('msp', 'doc', 'config', '_attr_cache', '_text_attr_cache')
+    
+    # 已完成图层/线型设置的文档 -> 设置时的配置版本号；
+    # 同一文档上再次创建适配器且配置未重新加载时跳过设置
+    _configured_docs = weakref.WeakKeyDictionary()
+    
     def __init__(self, msp, doc, config_manager: GBStandardConfig = None):
         """初始化适配器
         
@@ -20,13 +53,25 @@ class EzdxfAdapter:
         self.msp = msp
         self.doc = doc
         self.config = config_manager or GBStandardConfig()
-        
+        # 按 (图层, 线型) 缓存的实体属性字典
+        self._attr_cache: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+        # 按 (图层, 字高, 样式, 垂直对齐, 水平对齐) 缓存的文本公共属性字典
+        self._text_attr_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        # 预先为所有映射后的图层生成属性字典，绘图时按引用复用
+        for mapped_name in self.config.get_all_layer_mappings().values():
+            self._attrs(mapped_name)
+
         # 如果提供了文档对象，确保所需的图层和线型存在
         if doc:
             self._setup_document()
     
     def _setup_document(self):
         """设置文档的图层和线型，符合GB标准"""
+        version = self.config.get_version()
+        if self._configured_docs.get(self.doc) == version:
+            return
+        self._configured_docs[self.doc] = version
+        
         # 创建支持中文的字体样式
         if 'chinese' not in self.doc.styles:
             self.doc.styles.new('chinese', dxfattribs={
@@ -34,10 +79,15 @@ class EzdxfAdapter:
                 'bigfont': 'simsun.ttf'  # 必须指定bigfont以支持中文
             })
         
+        # 已有线型和图层名称的快照，表项名称不区分大小写，统一按小写比较
+        existing_linetypes = {entry.dxf.name.lower() for entry in self.doc.linetypes}
+        existing_layers = {entry.dxf.name.lower() for entry in self.doc.layers}
+        
         # 添加GB标准线型
         line_types = self.config.get_all_line_types()
         for linetype_name, line_config in line_types.items():
-            if linetype_name not in self.doc.linetypes:
+            if linetype_name.lower() not in existing_linetypes:
+                existing_linetypes.add(linetype_name.lower())
                 description = line_config.get('description', '')
                 pattern = line_config.get('pattern', [])
                 
@@ -54,20 +104,13 @@ class EzdxfAdapter:
         # 添加所有图层并设置正确的线型
         layer_mappings = self.config.get_all_layer_mappings()
         for logical_layer, mapped_name in layer_mappings.items():
-            if mapped_name not in self.doc.layers:
+            if mapped_name.lower() not in existing_layers:
+                existing_layers.add(mapped_name.lower())
                 # 默认为白色
                 layer_color = 7
                 
                 # 根据图层名称推断线型
-                linetype = 'CONTINUOUS'
-                if '中心线' in mapped_name or logical_layer in ['CENTERLINE', 'AXIS']:
-                    linetype = 'CENTER'
-                elif '虚线' in mapped_name or logical_layer == 'HIDDEN':
-                    linetype = 'HIDDEN'
-                elif '双点长划线' in mapped_name or logical_layer == 'PHANTOM':
-                    linetype = 'PHANTOM'
-                elif '边界线' in mapped_name or logical_layer == 'BORDER':
-                    linetype = 'BORDER'
+                linetype = _infer_linetype(logical_layer, mapped_name)
                 
                 # 创建图层
                 self.doc.layers.new(name=mapped_name, dxfattribs={
@@ -75,29 +118,129 @@ class EzdxfAdapter:
                     'linetype': linetype
                 })
     
+    def _attrs(self, layer: str = None, linetype: str = None, 
+               attrs: Dict[str, Any] = None) -> Dict[str, Any]:
+        """获取实体属性字典
+        
+        无额外属性时直接返回按 (图层, 线型) 缓存的共享字典，ezdxf创建实体时只读取该字典；
+        有额外属性时返回合并后的新字典
+        """
+        key = (layer, linetype)
+        cached = self._attr_cache.get(key)
+        if cached is None:
+            cached = {'layer': layer} if layer else {}
+            if linetype:
+                cached['linetype'] = linetype
+            self._attr_cache[key] = cached
+        if attrs:
+            return {**cached, **attrs}
+        return cached
+    
+    def _text_attrs(self, layer: Optional[str], height: float, style: Optional[str], 
+                    valign: int, halign: int) -> Dict[str, Any]:
+        """获取文本公共属性字典，按 (图层, 字高, 样式, 对齐方式) 缓存共享，调用方不得修改"""
+        key = (layer, height, style, valign, halign)
+        cached = self._text_attr_cache.get(key)
+        if cached is None:
+            cached = {'height': height, 'halign': halign, 'valign': valign, 'rotation': 0}
+            # 可选属性仅在提供时写入
+            if layer is not None:
+                cached['layer'] = layer
+            if style is not None:
+                cached['style'] = style
+            self._text_attr_cache[key] = cached
+        return cached
+    
     def add_line(self, start: Tuple[float, float], end: Tuple[float, float], 
                 layer: str = None, linetype: str = None, **attrs) -> Any:
-        """添加直线"""
-        dxfattribs = {'layer': layer} if layer else {}
-        if linetype:
-            dxfattribs['linetype'] = linetype
-        dxfattribs.update(attrs)
+        """添加直线
+        
+        直接通过new_entity创建实体，端点随属性字典一次传入，跳过add_line的参数转换层
+        """
+        dxfattribs = self._attrs(layer, linetype, attrs)
         
-        return self.msp.add_line(start, end, dxfattribs=dxfattribs)
+        return self.msp.new_entity('LINE', {**dxfattribs, 'start': start, 'end': end})
+    
+    def add_lines_batch(self, segments: Iterable[Tuple[Tuple[float, float], Tuple[float, float]]], 
+                       layer: str = None, linetype: str = None, **attrs) -> List[Any]:
+        """批量添加直线
+        
+        所有线段共用一份属性字典，直接构造LINE实体并加入模型空间，
+        省去逐条调用add_line时的属性合并开销
+        
+        Args:
+            segments: 线段端点序列 [((x1, y1), (x2, y2)), ...]
+            layer: 图层名称
+            linetype: 线型名称
+            
+        Returns:
+            创建的直线实体列表
+        """
+        dxfattribs = self._attrs(layer, linetype, attrs)
+        
+        add_entity = self.msp.add_entity
+        lines = []
+        for start, end in segments:
+            line = Line.new(dxfattribs=dxfattribs)
+            line.dxf.start = start
+            line.dxf.end = end
+            add_entity(line)
+            lines.append(line)
+        return lines
+    
+    def add_points_batch(self, points: Iterable[Tuple[float, float]], 
+                        layer: str = None, **attrs) -> List[Any]:
+        """批量添加点
+        
+        Args:
+            points: 点坐标序列 [(x1, y1), (x2, y2), ...]
+            layer: 图层名称
+            
+        Returns:
+            创建的点实体列表
+        """
+        dxfattribs = self._attrs(layer, None, attrs)
+        
+        add_entity = self.msp.add_entity
+        result = []
+        for location in points:
+            point = Point.new(dxfattribs=dxfattribs)
+            point.dxf.location = location
+            add_entity(point)
+            result.append(point)
+        return result
     
     def add_circle(self, center: Tuple[float, float], radius: float, 
                   layer: str = None, **attrs) -> Any:
         """添加圆形"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
+        
+        return self.msp.new_entity('CIRCLE', {**dxfattribs, 'center': center, 'radius': float(radius)})
+    
+    def add_circles_batch(self, centers: Iterable[Tuple[float, float]], radii: Iterable[float], 
+                         layer: str = None, **attrs) -> List[Any]:
+        """批量添加圆形
+        
+        Args:
+            centers: 圆心坐标序列
+            radii: 与圆心一一对应的半径序列
+            layer: 图层名称
+            
+        Returns:
+            创建的圆实体列表
+        """
+        dxfattribs = self._attrs(layer, None, attrs)
         
-        return self.msp.add_circle(center, radius, dxfattribs=dxfattribs)
+        new_entity = self.msp.new_entity
+        return [
+            new_entity('CIRCLE', {**dxfattribs, 'center': center, 'radius': float(radius)})
+            for center, radius in zip(centers, radii)
+        ]
     
     def add_arc(self, center: Tuple[float, float], radius: float, 
                start_angle: float, end_angle: float, layer: str = None, **attrs) -> Any:
         """添加圆弧"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_arc(
             center=center,
@@ -111,8 +254,7 @@ class EzdxfAdapter:
                    ratio: float, start_param: float = 0, end_param: float = 6.283185307, 
                    layer: str = None, **attrs) -> Any:
         """添加椭圆"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_ellipse(
             center=center,
@@ -126,19 +268,47 @@ class EzdxfAdapter:
     def add_polyline(self, points: List[Tuple[float, float]], closed: bool = False, 
                     layer: str = None, **attrs) -> Any:
         """添加多段线"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         polyline = self.msp.add_polyline2d(points=points, dxfattribs=dxfattribs)
         if closed and len(points) > 2:
             polyline.close()
         return polyline
     
+    def add_polylines_batch(self, polylines: Iterable[List[Tuple[float, float]]], closed: bool = False, 
+                           layer: str = None, **attrs) -> List[Any]:
+        """批量添加多段线
+        
+        Args:
+            polylines: 多段线顶点序列的序列
+            closed: 是否闭合（顶点数大于2时生效）
+            layer: 图层名称
+            
+        Returns:
+            创建的多段线实体列表
+        """
+        dxfattribs = self._attrs(layer, None, attrs)
+        
+        add_polyline2d = self.msp.add_polyline2d
+        return [
+            add_polyline2d(points, close=closed and len(points) > 2, dxfattribs=dxfattribs)
+            for points in polylines
+        ]
+    
+    def add_lwpolyline(self, points: Iterable[Tuple[float, float]], closed: bool = False, 
+                      layer: str = None, **attrs) -> Any:
+        """添加轻量多段线（LWPOLYLINE）
+        
+        顶点紧凑存储在单个实体中，适合矩形框、符号笔画等只含直线段的轮廓
+        """
+        dxfattribs = self._attrs(layer, None, attrs)
+        
+        return self.msp.add_lwpolyline(points, format='xy', close=closed, dxfattribs=dxfattribs)
+    
     def add_spline(self, points: List[Tuple[float, float]], degree: int = 3, 
                   layer: str = None, **attrs) -> Any:
         """添加样条曲线"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_spline(
             control_points=points,
@@ -146,15 +316,18 @@ class EzdxfAdapter:
             dxfattribs=dxfattribs
         )
     
-    def add_hatch(self, points: List[Tuple[float, float]], pattern: str = 'ANSI31', 
+    def add_hatch(self, points: Iterable[Tuple[float, float]], pattern: str = 'ANSI31', 
                  layer: str = None, scale: float = 1.0, **attrs) -> Any:
-        """添加填充区域"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        """添加填充区域
+        
+        边界以闭合多段线路径添加，由is_closed隐式闭合，无需重复首点；
+        points可为坐标列表或 (N, 2) 数组
+        """
+        dxfattribs = self._attrs(layer, None, attrs)
         
         hatch = self.msp.add_hatch(dxfattribs=dxfattribs)
         hatch.set_pattern_fill(pattern, scale=scale)
-        hatch.paths.add_polyline_path(points + [points[0]], is_closed=True)
+        hatch.paths.add_polyline_path(points, is_closed=True)
         return hatch
     
     def add_text(self, text: str, position: Tuple[float, float], height: float = 2.5, 
@@ -162,29 +335,75 @@ class EzdxfAdapter:
                 halign: int = 1, **attrs) -> Any:
         """添加文本"""
         x, y = position
+        position = (x, y)
         dxfattribs = {
-            'height': height,
-            'layer': layer,
-            'style': style,
-            'insert': (x, y),
-            'halign': halign,
-            'valign': valign,
-            'align_point': (x, y),
-            'rotation': 0
+            **self._text_attrs(layer, height, style, valign, halign),
+            'insert': position,
+            'align_point': position
         }
-        # 过滤掉None值
-        dxfattribs = {k: v for k, v in dxfattribs.items() if v is not None}
-        dxfattribs.update(attrs)
+        if attrs:
+            dxfattribs.update(attrs)
         
         return self.msp.add_text(text, dxfattribs=dxfattribs)
     
+    def add_underlined_text(self, text: str, position: Tuple[float, float], underline_length: float, 
+                            height: float = 2.5, layer: str = None, style: str = 'chinese') -> Tuple[Any, Any]:
+        """添加带下划线的文本
+        
+        Args:
+            text: 文本内容
+            position: 文本位置（下划线以其横坐标居中）
+            underline_length: 下划线长度
+            height: 文字高度
+            layer: 图层名称
+            style: 文字样式
+            
+        Returns:
+            (文本实体, 下划线实体)
+        """
+        text_obj = self.add_text(text, position, height=height, layer=layer, style=style)
+        
+        x, y = position
+        half = underline_length / 2
+        uy = y - height * 0.8
+        underline = self.msp.new_entity(
+            'LINE', {**self._attrs(layer), 'start': (x - half, uy), 'end': (x + half, uy)}
+        )
+        return text_obj, underline
+    
+    def add_texts_batch(self, texts: Iterable[str], positions: Iterable[Tuple[float, float]], 
+                       height: float = 2.5, layer: str = None, style: str = 'chinese', 
+                       valign: int = 1, halign: int = 1, **attrs) -> List[Any]:
+        """批量添加文本
+        
+        所有文本共用高度、图层、样式和对齐方式，公共属性取自缓存
+        
+        Args:
+            texts: 文本内容序列
+            positions: 与文本一一对应的位置序列
+            height: 文字高度
+            layer: 图层名称
+            style: 文字样式
+            
+        Returns:
+            创建的文本实体列表
+        """
+        common = self._text_attrs(layer, height, style, valign, halign)
+        if attrs:
+            common = {**common, **attrs}
+        
+        add_text = self.msp.add_text
+        return [
+            add_text(text, dxfattribs={**common, 'insert': position, 'align_point': position})
+            for text, position in zip(texts, positions)
+        ]
+    
     def add_linear_dim(self, base: Tuple[float, float], p1: Tuple[float, float], 
                       p2: Tuple[float, float], text: str = None, 
                       dimstyle: str = 'Standard', override: Dict = None, 
                       layer: str = None, **attrs) -> Any:
         """添加线性尺寸标注"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_linear_dim(
             base=base,
@@ -192,16 +411,58 @@ class EzdxfAdapter:
             p2=p2,
             text=text,
             dimstyle=dimstyle,
-            override=override or {},
+            override=override if override is not None else _EMPTY_OVERRIDE,
             dxfattribs=dxfattribs
         )
     
+    def add_linear_dims(self, p1s: np.ndarray, p2s: np.ndarray, bases: np.ndarray, 
+                       text: str = None, dimstyle: str = 'Standard', override: Dict = None, 
+                       overrides: Iterable[Dict] = None, angle: float = 0, 
+                       layer: str = None, **attrs) -> List[Any]:
+        """批量添加线性尺寸标注
+        
+        坐标以 (N, 2) 数组传入，一次性转换为Python浮点数后逐个创建标注，
+        所有标注共用同一份属性字典和样式覆盖
+        
+        Args:
+            p1s: 第一尺寸界线起点数组
+            p2s: 第二尺寸界线起点数组
+            bases: 尺寸线位置数组
+            text: 标注文字，None表示使用测量值
+            dimstyle: 标注样式名称
+            override: 所有标注共用的标注样式覆盖
+            overrides: 逐个标注的样式覆盖序列，提供时代替override；
+                       ezdxf创建标注时会复制覆盖内容，序列中可重复使用同一字典
+            angle: 尺寸线角度（度）
+            layer: 图层名称
+            
+        Returns:
+            标注对象列表
+        """
+        dxfattribs = self._attrs(layer, None, attrs)
+        
+        p1_list = np.asarray(p1s, dtype=float).tolist()
+        p2_list = np.asarray(p2s, dtype=float).tolist()
+        base_list = np.asarray(bases, dtype=float).tolist()
+        if not len(p1_list) == len(p2_list) == len(base_list):
+            raise ValueError("p1s, p2s and bases must have the same length")
+        
+        if overrides is None:
+            shared = override if override is not None else _EMPTY_OVERRIDE
+            overrides = itertools.repeat(shared, len(p1_list))
+        
+        add_linear_dim = self.msp.add_linear_dim
+        return [
+            add_linear_dim(base=base, p1=p1, p2=p2, text=text, dimstyle=dimstyle, angle=angle,
+                           override=dim_override, dxfattribs=dxfattribs)
+            for p1, p2, base, dim_override in zip(p1_list, p2_list, base_list, overrides)
+        ]
+    
     def add_radius_dim(self, center: Tuple[float, float], radius: float, 
                       angle: float, text: str = None, dimstyle: str = 'Standard', 
                       override: Dict = None, layer: str = None, **attrs) -> Any:
         """添加半径尺寸标注"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_radius_dim(
             center=center,
@@ -209,7 +470,7 @@ class EzdxfAdapter:
             angle=angle,
             text=text,
             dimstyle=dimstyle,
-            override=override or {},
+            override=override if override is not None else _EMPTY_OVERRIDE,
             dxfattribs=dxfattribs
         )
     
@@ -217,8 +478,7 @@ class EzdxfAdapter:
                         angle: float, text: str = None, dimstyle: str = 'Standard', 
                         override: Dict = None, layer: str = None, **attrs) -> Any:
         """添加直径尺寸标注"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_diameter_dim(
             center=center,
@@ -226,7 +486,7 @@ class EzdxfAdapter:
             angle=angle,
             text=text,
             dimstyle=dimstyle,
-            override=override or {},
+            override=override if override is not None else _EMPTY_OVERRIDE,
             dxfattribs=dxfattribs
         )
     
@@ -235,8 +495,7 @@ class EzdxfAdapter:
                        dimstyle: str = 'Standard', override: Dict = None, 
                        layer: str = None, **attrs) -> Any:
         """添加角度尺寸标注"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_angular_dim(
             center=center,
@@ -244,7 +503,7 @@ class EzdxfAdapter:
             p2=p2,
             text=text,
             dimstyle=dimstyle,
-            override=override or {},
+            override=override if override is not None else _EMPTY_OVERRIDE,
             dxfattribs=dxfattribs
         )
     
@@ -252,8 +511,7 @@ class EzdxfAdapter:
                        distance: float, text: str = None, dimstyle: str = 'Standard', 
                        override: Dict = None, layer: str = None, **attrs) -> Any:
         """添加对齐尺寸标注"""
-        dxfattribs = {'layer': layer} if layer else {}
-        dxfattribs.update(attrs)
+        dxfattribs = self._attrs(layer, None, attrs)
         
         return self.msp.add_aligned_dim(
             p1=p1,
@@ -261,6 +519,6 @@ class EzdxfAdapter:
             distance=distance,
             text=text,
             dimstyle=dimstyle,
-            override=override or {},
+            override=override if override is not None else _EMPTY_OVERRIDE,
             dxfattribs=dxfattribs
         ) 
\ No newline at end of file
@@ -1,9 +1,7 @@
-from typing import Dict, Type, Any, List
+import importlib
+import weakref
+from typing import Dict, Type, Any, List, Tuple, Union
 from .strategies.base import DrawingStrategy
-from .strategies.basic_shapes import BasicShapeDrawer
-from .strategies.dimensions import DimensionDrawer
-from .strategies.symbols import SymbolDrawer
-from .strategies.views import ViewDrawer
 
 
 class ComponentFactory:
@@ -12,10 +10,11 @@ class ComponentFactory:
     负责策略组件的注册、创建和管理，支持懒加载和实例缓存
     """
     
-    # 策略组件注册表
-    _strategies: Dict[str, Type[DrawingStrategy]] = {}
-    # 实例缓存
-    _instances: Dict[str, DrawingStrategy] = {}
+    # 策略组件注册表，值为策略类或尚未导入的 (模块路径, 类名)
+    _strategies: Dict[str, Union[Type[DrawingStrategy], Tuple[str, str]]] = {}
+    # 实例缓存，弱引用保存：策略不再被使用时自动移除，也不会让画布和配置常驻内存；
+    # 缓存项存活期间策略持有画布和配置，id不会被复用
+    _instances: 'weakref.WeakValueDictionary[Tuple[str, int, int], DrawingStrategy]' = weakref.WeakValueDictionary()
     
     @classmethod
     def register_strategy(cls, name: str, strategy_class: Type[DrawingStrategy]):
@@ -49,14 +48,15 @@ class ComponentFactory:
             raise ValueError(f"Unknown strategy: {name}. Available strategies: {list(cls._strategies.keys())}")
         
         # 创建缓存key
-        cache_key = f"{name}_{id(canvas)}_{id(config)}"
+        cache_key = (name, id(canvas), id(config))
         
         # 检查缓存
-        if cache_key in cls._instances:
-            return cls._instances[cache_key]
+        instance = cls._instances.get(cache_key)
+        if instance is not None:
+            return instance
         
         # 创建新实例
-        strategy_class = cls._strategies[name]
+        strategy_class = cls._resolve_strategy(name)
         instance = strategy_class(canvas, config)
         
         # 缓存实例
@@ -64,6 +64,16 @@ class ComponentFactory:
         
         return instance
     
+    @classmethod
+    def _resolve_strategy(cls, name: str) -> Type[DrawingStrategy]:
+        """获取策略类，首次使用时导入其模块并写回注册表"""
+        strategy_class = cls._strategies[name]
+        if isinstance(strategy_class, tuple):
+            module_name, class_name = strategy_class
+            strategy_class = getattr(importlib.import_module(module_name), class_name)
+            cls._strategies[name] = strategy_class
+        return strategy_class
+    
     @classmethod
     def list_strategies(cls) -> List[str]:
         """获取所有注册的策略名称列表
@@ -80,12 +90,17 @@ class ComponentFactory:
     
     @classmethod
     def _auto_register_strategies(cls):
-        """自动注册所有策略组件"""
+        """自动注册所有策略组件
+        
+        默认策略只登记模块路径和类名，在首次create_strategy时才导入
+        """
         # 注册默认策略组件
-        cls.register_strategy('basic_shapes', BasicShapeDrawer)
-        cls.register_strategy('dimensions', DimensionDrawer)
-        cls.register_strategy('symbols', SymbolDrawer)
-        cls.register_strategy('views', ViewDrawer)
+        cls._strategies.update({
+            'basic_shapes': ('mechdrawkit.core.strategies.basic_shapes', 'BasicShapeDrawer'),
+            'dimensions': ('mechdrawkit.core.strategies.dimensions', 'DimensionDrawer'),
+            'symbols': ('mechdrawkit.core.strategies.symbols', 'SymbolDrawer'),
+            'views': ('mechdrawkit.core.strategies.views', 'ViewDrawer'),
+        })
 
 
 # 自动注册默认策略组件
@@ -1,5 +1,42 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict
+from abc import ABC
+from typing import Any, Callable, Dict, FrozenSet, Tuple
+
+
+# 策略共用的逻辑图层名称
+LAYER_PARTS = 'PARTS'
+LAYER_VISIBLE = 'VISIBLE'
+LAYER_CENTERLINE = 'CENTERLINE'
+LAYER_HIDDEN = 'HIDDEN'
+LAYER_PHANTOM = 'PHANTOM'
+LAYER_BORDER = 'BORDER'
+LAYER_HATCH = 'HATCH'
+LAYER_DIMENSIONS = 'DIMENSIONS'
+LAYER_TEXT = 'TEXT'
+LAYER_SURFACE_FINISH = 'SURFACE_FINISH'
+LAYER_TOLERANCE = 'TOLERANCE'
+LAYER_WELD_SYMBOL = 'WELD_SYMBOL'
+LAYER_CUTTING_PLANE = 'CUTTING_PLANE'
+LAYER_DETAIL = 'DETAIL'
+
+# 策略共用的线型名称
+LINETYPE_CENTER = 'CENTER'
+LINETYPE_HIDDEN = 'HIDDEN'
+LINETYPE_PHANTOM = 'PHANTOM'
+LINETYPE_BORDER = 'BORDER'
+
+
+def register_op(name: str) -> Callable:
+    """将策略方法注册为绘图操作
+    
+    被装饰的方法在子类创建时收集到该类的 _OPS 分发表中，由 draw 按操作名直接调用
+    
+    Args:
+        name: 操作类型字符串
+    """
+    def decorator(func: Callable) -> Callable:
+        func._draw_op = name
+        return func
+    return decorator
 
 
 class DrawingStrategy(ABC):
@@ -8,6 +45,26 @@ class DrawingStrategy(ABC):
     定义所有绘图策略必须实现的接口规范
     """
     
+    __slots__ = ('canvas', 'config', '_layer_cache', '_layer_version', '__weakref__')
+    
+    # 操作名 -> 方法 的分发表，由 __init_subclass__ 根据 register_op 标记生成
+    _OPS: Dict[str, Callable] = {}
+    # 构造时预先解析的常用逻辑图层，由子类定义
+    _PRELOAD_LAYERS: Tuple[str, ...] = ()
+    # 操作名 -> 必需参数集合，由子类定义
+    _REQUIRED_KEYS: Dict[str, FrozenSet[str]] = {}
+    # 操作名 -> 参数数值检查函数，由子类定义
+    _NUMERIC_CHECKS: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        ops = dict(cls._OPS)
+        for attr in vars(cls).values():
+            op = getattr(attr, '_draw_op', None)
+            if op is not None:
+                ops[op] = attr
+        cls._OPS = ops
+    
     def __init__(self, canvas_adapter, config_manager):
         """初始化绘图策略
         
@@ -17,11 +74,19 @@ class DrawingStrategy(ABC):
         """
         self.canvas = canvas_adapter
         self.config = config_manager
+        # 逻辑图层 -> 物理图层 的映射缓存，及其对应的配置版本号
+        self._layer_cache: Dict[str, str] = {}
+        self._layer_version = config_manager.get_version()
+        for layer in self._PRELOAD_LAYERS:
+            self._get_layer(layer)
+        self._bind_layers()
     
-    @abstractmethod
     def draw(self, operation: str, **kwargs) -> Any:
         """执行绘图操作
         
+        默认实现：经 validate_params 验证参数后，按 _OPS 分发表调用注册的操作方法；
+        子类可重写 validate_params 定制验证，或重写 draw 自行分发
+        
         Args:
             operation: 操作类型字符串
             **kwargs: 操作参数
@@ -33,11 +98,42 @@ class DrawingStrategy(ABC):
             ValueError: 当操作类型不支持时
             TypeError: 当参数类型错误时
         """
-        pass
+        if not self.validate_params(operation, **kwargs):
+            raise ValueError(f"Invalid parameters for operation: {operation}")
+        
+        method = self._OPS.get(operation)
+        if method is None:
+            raise ValueError(f"Unsupported operation: {operation}")
+        # 配置重新加载后，缓存的映射和快速绘制入口作废
+        if self._layer_version != self.config.get_version():
+            self.invalidate_layer_cache()
+        return method(self, **kwargs)
+    
+    def draw_unchecked(self, operation: str, **kwargs) -> Any:
+        """执行绘图操作，跳过参数验证
+        
+        供参数已预先验证的批量流程（如绘图模板）使用，外部调用应使用 draw
+        
+        Args:
+            operation: 操作类型字符串
+            **kwargs: 操作参数
+            
+        Returns:
+            绘图结果对象
+            
+        Raises:
+            KeyError: 当操作类型不支持时
+        """
+        method = self._OPS[operation]
+        if self._layer_version != self.config.get_version():
+            self.invalidate_layer_cache()
+        return method(self, **kwargs)
     
     def validate_params(self, operation: str, **kwargs) -> bool:
         """参数验证
         
+        默认按 _REQUIRED_KEYS 和 _NUMERIC_CHECKS 验证，draw 在分发前调用
+        
         Args:
             operation: 操作类型
             **kwargs: 操作参数
@@ -45,10 +141,17 @@ class DrawingStrategy(ABC):
         Returns:
             bool: 参数是否有效
         """
-        # 默认实现：基本验证
         if not operation:
             return False
-        return True
+        return self._params_valid(operation, kwargs)
+    
+    def _params_valid(self, operation: str, kwargs: Dict[str, Any]) -> bool:
+        """按 _REQUIRED_KEYS 和 _NUMERIC_CHECKS 验证参数，未登记的操作视为有效"""
+        required = self._REQUIRED_KEYS.get(operation)
+        if required is not None and not required.issubset(kwargs):
+            return False
+        check = self._NUMERIC_CHECKS.get(operation)
+        return check is None or check(kwargs)
     
     def _get_layer(self, layer: str) -> str:
         """获取映射后的图层名称
@@ -59,4 +162,17 @@ class DrawingStrategy(ABC):
         Returns:
             str: 映射后的物理图层名称
         """
-        return self.config.get_layer_mapping(layer) 
\ No newline at end of file
+        mapped = self._layer_cache.get(layer)
+        if mapped is None:
+            mapped = self._layer_cache[layer] = self.config.get_layer_mapping(layer)
+        return mapped
+    
+    def _bind_layers(self):
+        """按当前图层映射绑定默认图层的快速绘制入口，由子类按需实现"""
+        pass
+    
+    def invalidate_layer_cache(self):
+        """清空图层映射缓存并重新绑定快速绘制入口，配置重新加载后自动调用"""
+        self._layer_cache.clear()
+        self._layer_version = self.config.get_version()
+        self._bind_layers() 
\ No newline at end of file
@@ -1,146 +1,240 @@
+from functools import partial
 from typing import Any, Tuple, List, Optional
-from .base import DrawingStrategy
+import numpy as np
+from .base import (
+    DrawingStrategy, register_op,
+    LAYER_PARTS, LAYER_VISIBLE, LAYER_CENTERLINE, LAYER_HIDDEN, LAYER_PHANTOM, LAYER_BORDER, LAYER_HATCH,
+    LINETYPE_CENTER, LINETYPE_HIDDEN, LINETYPE_PHANTOM, LINETYPE_BORDER
+)
+
+
+# 直线类操作共用的必需参数
+_LINE_KEYS = frozenset(('start', 'end'))
 
 
 class BasicShapeDrawer(DrawingStrategy):
     """基础图形绘制策略
     
     负责绘制圆形、矩形、直线、多段线、圆弧、椭圆、样条曲线等基础几何图形
+    
+    支持的操作: 'circle', 'rectangle', 'line', 'centerline', 'hiddenline', 'phantomline',
+    'borderline', 'polyline', 'arc', 'ellipse', 'spline', 'hatch'
+    
+    批量操作: 'lines', 'circles', 'polylines', 'rectangles'，坐标可直接传入numpy数组；'centerlines'
     """
     
-    def draw(self, operation: str, **kwargs) -> Any:
-        """执行基础图形绘制操作
+    __slots__ = ('_add_parts_rect', '_add_parts_circle', '_add_visible_line', '_add_centerline',
+                 '_add_centerlines', '_add_hiddenline', '_add_phantomline', '_add_borderline')
+    
+    _PRELOAD_LAYERS = (LAYER_PARTS, LAYER_VISIBLE, LAYER_CENTERLINE, LAYER_HIDDEN,
+                       LAYER_PHANTOM, LAYER_BORDER, LAYER_HATCH)
+    
+    # 各操作的必需参数
+    _REQUIRED_KEYS = {
+        'circle': frozenset(('center', 'radius')),
+        'rectangle': frozenset(('lower_left', 'width', 'height')),
+        'line': _LINE_KEYS,
+        'centerline': _LINE_KEYS,
+        'hiddenline': _LINE_KEYS,
+        'phantomline': _LINE_KEYS,
+        'borderline': _LINE_KEYS,
+        'polyline': frozenset(('points',)),
+        'arc': frozenset(('center', 'radius', 'start_angle', 'end_angle')),
+        'ellipse': frozenset(('center', 'major_axis', 'ratio')),
+        'spline': frozenset(('points',)),
+        'hatch': frozenset(('points',)),
+        'lines': frozenset(('segments',)),
+        'circles': frozenset(('centers', 'radii')),
+        'polylines': frozenset(('polylines',)),
+        'centerlines': frozenset(('segments',)),
+        'rectangles': frozenset(('corners',)),
+    }
+    
+    # 各操作的数值检查
+    _NUMERIC_CHECKS = {
+        'circle': lambda kw: kw['radius'] > 0,
+        'rectangle': lambda kw: kw['width'] > 0 and kw['height'] > 0,
+        'polyline': lambda kw: len(kw['points']) >= 2,
+        'arc': lambda kw: kw['radius'] > 0,
+        'spline': lambda kw: len(kw['points']) >= 2,
+        'hatch': lambda kw: len(kw['points']) >= 3,
+        'circles': lambda kw: bool(np.all(np.asarray(kw['radii']) > 0)),
+        'polylines': lambda kw: all(len(points) >= 2 for points in kw['polylines']),
+    }
+    
+    def _bind_layers(self):
+        """绑定默认图层的快速绘制入口，默认图层调用时跳过图层解析
         
-        Args:
-            operation: 操作类型 ('circle', 'rectangle', 'line', 'polyline', 'arc', 'ellipse', 'spline')
-            **kwargs: 操作参数
-            
-        Returns:
-            绘图结果对象
+        配置重新加载后由 invalidate_layer_cache 按新的图层映射重新绑定
         """
-        if not self.validate_params(operation, **kwargs):
-            raise ValueError(f"Invalid parameters for operation: {operation}")
-        
-        if operation == 'circle':
-            return self._draw_circle(**kwargs)
-        elif operation == 'rectangle':
-            return self._draw_rectangle(**kwargs)
-        elif operation == 'line':
-            return self._draw_line(**kwargs)
-        elif operation == 'centerline':
-            return self._draw_centerline(**kwargs)
-        elif operation == 'hiddenline':
-            return self._draw_hiddenline(**kwargs)
-        elif operation == 'phantomline':
-            return self._draw_phantomline(**kwargs)
-        elif operation == 'borderline':
-            return self._draw_borderline(**kwargs)
-        elif operation == 'polyline':
-            return self._draw_polyline(**kwargs)
-        elif operation == 'arc':
-            return self._draw_arc(**kwargs)
-        elif operation == 'ellipse':
-            return self._draw_ellipse(**kwargs)
-        elif operation == 'spline':
-            return self._draw_spline(**kwargs)
-        elif operation == 'hatch':
-            return self._draw_hatch(**kwargs)
-        else:
-            raise ValueError(f"Unsupported operation: {operation}")
+        canvas = self.canvas
+        get_layer = self._get_layer
+        self._add_parts_rect = partial(canvas.add_lwpolyline, closed=True, layer=get_layer(LAYER_PARTS))
+        self._add_parts_circle = partial(canvas.add_circle, layer=get_layer(LAYER_PARTS))
+        self._add_visible_line = partial(canvas.add_line, layer=get_layer(LAYER_VISIBLE))
+        self._add_centerline = partial(canvas.add_line, layer=get_layer(LAYER_CENTERLINE), linetype=LINETYPE_CENTER)
+        self._add_centerlines = partial(canvas.add_lines_batch, layer=get_layer(LAYER_CENTERLINE),
+                                        linetype=LINETYPE_CENTER)
+        self._add_hiddenline = partial(canvas.add_line, layer=get_layer(LAYER_HIDDEN), linetype=LINETYPE_HIDDEN)
+        self._add_phantomline = partial(canvas.add_line, layer=get_layer(LAYER_PHANTOM), linetype=LINETYPE_PHANTOM)
+        self._add_borderline = partial(canvas.add_line, layer=get_layer(LAYER_BORDER), linetype=LINETYPE_BORDER)
     
-    def _draw_circle(self, center: Tuple[float, float], radius: float, layer: str = 'PARTS') -> Any:
+    @register_op('circle')
+    def _draw_circle(self, center: Tuple[float, float], radius: float, layer: str = LAYER_PARTS) -> Any:
         """绘制圆形"""
+        if layer == LAYER_PARTS:
+            return self._add_parts_circle(center, radius)
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_circle(center, radius, layer=mapped_layer)
     
-    def _draw_rectangle(self, lower_left: Tuple[float, float], width: float, height: float, layer: str = 'PARTS') -> Any:
-        """绘制矩形"""
-        x, y = lower_left
-        mapped_layer = self._get_layer(layer)
+    @register_op('rectangle')
+    def _draw_rectangle(self, lower_left: Tuple[float, float], width: float, height: float, layer: str = LAYER_PARTS) -> Any:
+        """绘制矩形
         
-        # 绘制四条边线
-        lines = []
-        lines.append(self.canvas.add_line((x, y), (x + width, y), layer=mapped_layer))
-        lines.append(self.canvas.add_line((x + width, y), (x + width, y + height), layer=mapped_layer))
-        lines.append(self.canvas.add_line((x + width, y + height), (x, y + height), layer=mapped_layer))
-        lines.append(self.canvas.add_line((x, y + height), (x, y), layer=mapped_layer))
+        Returns:
+            单个闭合LWPOLYLINE实体
+        """
+        x, y = lower_left
+        corners = [(x, y), (x + width, y), (x + width, y + height), (x, y + height)]
+        if layer == LAYER_PARTS:
+            return self._add_parts_rect(corners)
         
-        return lines
+        mapped_layer = self._get_layer(layer)
+        return self.canvas.add_lwpolyline(corners, closed=True, layer=mapped_layer)
     
-    def _draw_line(self, start: Tuple[float, float], end: Tuple[float, float], layer: str = 'VISIBLE') -> Any:
+    @register_op('line')
+    def _draw_line(self, start: Tuple[float, float], end: Tuple[float, float], layer: str = LAYER_VISIBLE) -> Any:
         """绘制直线"""
+        if layer == LAYER_VISIBLE:
+            return self._add_visible_line(start, end)
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_line(start, end, layer=mapped_layer)
     
+    @register_op('centerline')
     def _draw_centerline(self, start: Tuple[float, float], end: Tuple[float, float]) -> Any:
         """绘制中心线"""
-        mapped_layer = self._get_layer('CENTERLINE')
-        return self.canvas.add_line(start, end, layer=mapped_layer, linetype='CENTER')
+        return self._add_centerline(start, end)
+    
+    @register_op('centerlines')
+    def _draw_centerlines(self, segments: List[Tuple[Tuple[float, float], Tuple[float, float]]]) -> List[Any]:
+        """批量绘制中心线
+        
+        Args:
+            segments: 线段端点序列 [((x1, y1), (x2, y2)), ...]
+            
+        Returns:
+            中心线实体列表
+        """
+        return self._add_centerlines(segments)
     
+    @register_op('hiddenline')
     def _draw_hiddenline(self, start: Tuple[float, float], end: Tuple[float, float]) -> Any:
         """绘制隐藏线"""
-        mapped_layer = self._get_layer('HIDDEN')
-        return self.canvas.add_line(start, end, layer=mapped_layer, linetype='HIDDEN')
+        return self._add_hiddenline(start, end)
     
+    @register_op('phantomline')
     def _draw_phantomline(self, start: Tuple[float, float], end: Tuple[float, float]) -> Any:
         """绘制幻影线/双点长划线"""
-        mapped_layer = self._get_layer('PHANTOM')
-        return self.canvas.add_line(start, end, layer=mapped_layer, linetype='PHANTOM')
+        return self._add_phantomline(start, end)
     
+    @register_op('borderline')
     def _draw_borderline(self, start: Tuple[float, float], end: Tuple[float, float]) -> Any:
         """绘制边界线"""
-        mapped_layer = self._get_layer('BORDER')
-        return self.canvas.add_line(start, end, layer=mapped_layer, linetype='BORDER')
+        return self._add_borderline(start, end)
     
-    def _draw_polyline(self, points: List[Tuple[float, float]], closed: bool = False, layer: str = 'PARTS') -> Any:
+    @register_op('polyline')
+    def _draw_polyline(self, points: List[Tuple[float, float]], closed: bool = False, layer: str = LAYER_PARTS) -> Any:
         """绘制多段线"""
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_polyline(points, closed=closed, layer=mapped_layer)
     
-    def _draw_arc(self, center: Tuple[float, float], radius: float, start_angle: float, end_angle: float, layer: str = 'PARTS') -> Any:
+    @register_op('arc')
+    def _draw_arc(self, center: Tuple[float, float], radius: float, start_angle: float, end_angle: float, layer: str = LAYER_PARTS) -> Any:
         """绘制圆弧"""
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_arc(center, radius, start_angle, end_angle, layer=mapped_layer)
     
+    @register_op('ellipse')
     def _draw_ellipse(self, center: Tuple[float, float], major_axis: Tuple[float, float], ratio: float,
-                      start_param: float = 0, end_param: float = 6.283185307, layer: str = 'PARTS') -> Any:
+                      start_param: float = 0, end_param: float = 6.283185307, layer: str = LAYER_PARTS) -> Any:
         """绘制椭圆"""
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_ellipse(center, major_axis, ratio, start_param, end_param, layer=mapped_layer)
     
-    def _draw_spline(self, points: List[Tuple[float, float]], degree: int = 3, layer: str = 'PARTS') -> Any:
+    @register_op('spline')
+    def _draw_spline(self, points: List[Tuple[float, float]], degree: int = 3, layer: str = LAYER_PARTS) -> Any:
         """绘制样条曲线"""
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_spline(points, degree=degree, layer=mapped_layer)
     
-    def _draw_hatch(self, points: List[Tuple[float, float]], pattern: str = 'ANSI31', layer: str = 'HATCH', scale: float = 1.0) -> Any:
+    @register_op('hatch')
+    def _draw_hatch(self, points: List[Tuple[float, float]], pattern: str = 'ANSI31', layer: str = LAYER_HATCH, scale: float = 1.0) -> Any:
         """绘制填充区域"""
         mapped_layer = self._get_layer(layer)
         return self.canvas.add_hatch(points, pattern=pattern, layer=mapped_layer, scale=scale)
     
-    def validate_params(self, operation: str, **kwargs) -> bool:
-        """验证基础图形参数"""
-        if not super().validate_params(operation, **kwargs):
-            return False
+    @register_op('lines')
+    def _draw_lines(self, segments, layer: str = LAYER_VISIBLE) -> List[Any]:
+        """批量绘制直线
         
-        # 针对不同操作类型进行特定验证
-        if operation == 'circle':
-            return 'center' in kwargs and 'radius' in kwargs and kwargs['radius'] > 0
-        elif operation == 'rectangle':
-            return ('lower_left' in kwargs and 'width' in kwargs and 'height' in kwargs 
-                    and kwargs['width'] > 0 and kwargs['height'] > 0)
-        elif operation in ['line', 'centerline', 'hiddenline', 'phantomline', 'borderline']:
-            return 'start' in kwargs and 'end' in kwargs
-        elif operation == 'polyline':
-            return 'points' in kwargs and len(kwargs['points']) >= 2
-        elif operation == 'arc':
-            return ('center' in kwargs and 'radius' in kwargs and 'start_angle' in kwargs 
-                    and 'end_angle' in kwargs and kwargs['radius'] > 0)
-        elif operation == 'ellipse':
-            return 'center' in kwargs and 'major_axis' in kwargs and 'ratio' in kwargs
-        elif operation == 'spline':
-            return 'points' in kwargs and len(kwargs['points']) >= 2
-        elif operation == 'hatch':
-            return 'points' in kwargs and len(kwargs['points']) >= 3
+        Args:
+            segments: (N, 4) 或 (N, 2, 2) 数组，或 [((x1, y1), (x2, y2)), ...]
+            layer: 图层名称
+            
+        Returns:
+            直线实体列表
+        """
+        mapped_layer = self._get_layer(layer)
+        segments = np.asarray(segments, dtype=float).reshape(-1, 2, 2).tolist()
+        return self.canvas.add_lines_batch(segments, layer=mapped_layer)
+    
+    @register_op('circles')
+    def _draw_circles(self, centers, radii, layer: str = LAYER_PARTS) -> List[Any]:
+        """批量绘制圆形
+        
+        Args:
+            centers: (N, 2) 圆心数组
+            radii: 半径，标量（所有圆相同）或长度为N的数组
+            layer: 图层名称
+            
+        Returns:
+            圆实体列表
+        """
+        mapped_layer = self._get_layer(layer)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        radii = np.broadcast_to(np.asarray(radii, dtype=float), (len(centers),))
+        return self.canvas.add_circles_batch(centers.tolist(), radii.tolist(), layer=mapped_layer)
+    
+    @register_op('rectangles')
+    def _draw_rectangles(self, corners, layer: str = LAYER_PARTS) -> List[Any]:
+        """批量绘制矩形
         
-        return True 
\ No newline at end of file
+        Args:
+            corners: (N, 4, 2) 角点数组，如 shaft_layout 的输出
+            layer: 图层名称
+            
+        Returns:
+            闭合LWPOLYLINE实体列表
+        """
+        corners = np.asarray(corners, dtype=float).reshape(-1, 4, 2).tolist()
+        if layer == LAYER_PARTS:
+            add_rect = self._add_parts_rect
+        else:
+            add_rect = partial(self.canvas.add_lwpolyline, closed=True, layer=self._get_layer(layer))
+        return [add_rect(rect) for rect in corners]
+    
+    @register_op('polylines')
+    def _draw_polylines(self, polylines, closed: bool = False, layer: str = LAYER_PARTS) -> List[Any]:
+        """批量绘制多段线
+        
+        Args:
+            polylines: 多段线顶点序列的序列，每条可为 (M, 2) 数组
+            closed: 是否闭合
+            layer: 图层名称
+            
+        Returns:
+            多段线实体列表
+        """
+        mapped_layer = self._get_layer(layer)
+        polylines = [np.asarray(points, dtype=float).tolist() for points in polylines]
+        return self.canvas.add_polylines_batch(polylines, closed=closed, layer=mapped_layer)
\ No newline at end of file
@@ -1,192 +1,168 @@
 import math
+from types import MappingProxyType
+import numpy as np
 from typing import Any, Tuple, List, Optional
-from .base import DrawingStrategy
+from .base import DrawingStrategy, register_op, LAYER_DIMENSIONS
+
+
+# 尺寸标注共用的样式覆盖（只读）
+_DIM_OVERRIDE = MappingProxyType({'dimdle': 0.5, 'dimexe': 0.5})
+
+# 半径/直径标注默认角度对应的弧度
+_RAD_45 = math.radians(45)
+
+
+def _offset_overrides(offsets: List[float]):
+    """依次生成带dimexo偏移的样式覆盖
+    
+    ezdxf创建标注时复制样式覆盖，因此复用同一字典，每次只更新偏移量
+    """
+    override = {**_DIM_OVERRIDE, 'dimexo': 0.0}
+    for offset in offsets:
+        override['dimexo'] = offset
+        yield override
+
+
+def _linear_base(p1: Tuple[float, float], p2: Tuple[float, float], distance: float) -> Tuple[float, float]:
+    """线性标注的尺寸线位置：两点左下角下方distance处"""
+    x1, y1 = p1
+    x2, y2 = p2
+    return (x1 if x1 < x2 else x2, (y1 if y1 < y2 else y2) - distance)
 
 
 class DimensionDrawer(DrawingStrategy):
     """尺寸标注绘制策略
     
     负责绘制各种类型的尺寸标注，包括线性标注、半径标注、直径标注、角度标注等
+    
+    支持的操作: 'linear', 'radius', 'diameter', 'angular', 'aligned', 'baseline', 'tolerance'
     """
     
-    def draw(self, operation: str, **kwargs) -> Any:
-        """执行尺寸标注绘制操作
-        
-        Args:
-            operation: 操作类型 ('linear', 'radius', 'diameter', 'angular', 'aligned', 'baseline', 'tolerance')
-            **kwargs: 操作参数
-            
-        Returns:
-            绘图结果对象
-        """
-        if not self.validate_params(operation, **kwargs):
-            raise ValueError(f"Invalid parameters for operation: {operation}")
-        
-        if operation == 'linear':
-            return self._add_dimension(**kwargs)
-        elif operation == 'radius':
-            return self._add_radius_dimension(**kwargs)
-        elif operation == 'diameter':
-            return self._add_diameter_dimension(**kwargs)
-        elif operation == 'angular':
-            return self._add_angular_dimension(**kwargs)
-        elif operation == 'aligned':
-            return self._add_aligned_dimension(**kwargs)
-        elif operation == 'baseline':
-            return self._add_baseline_dimensions(**kwargs)
-        elif operation == 'tolerance':
-            return self._add_dimension_with_tolerance(**kwargs)
-        else:
-            raise ValueError(f"Unsupported operation: {operation}")
+    __slots__ = ()
     
+    _PRELOAD_LAYERS = (LAYER_DIMENSIONS,)
+    
+    # 各操作的必需参数
+    _REQUIRED_KEYS = {
+        'linear': frozenset(('p1', 'p2', 'distance')),
+        'radius': frozenset(('center', 'radius')),
+        'diameter': frozenset(('center', 'radius')),
+        'angular': frozenset(('center', 'p1', 'p2')),
+        'aligned': frozenset(('p1', 'p2', 'distance')),
+        'baseline': frozenset(('base_point', 'points')),
+        'tolerance': frozenset(('p1', 'p2', 'distance', 'nominal', 'upper_tol', 'lower_tol')),
+    }
+    
+    # 各操作的数值检查
+    _NUMERIC_CHECKS = {
+        'radius': lambda kw: kw['radius'] > 0,
+        'diameter': lambda kw: kw['radius'] > 0,
+        'baseline': lambda kw: len(kw['points']) > 0,
+    }
+    
+    @register_op('linear')
     def _add_dimension(self, p1: Tuple[float, float], p2: Tuple[float, float], distance: float, text: str = None) -> Any:
         """添加直线尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
-        override_dict = {'dimdle': 0.5, 'dimexe': 0.5}
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
         
         return self.canvas.add_linear_dim(
-            base=(min(p1[0], p2[0]), min(p1[1], p2[1]) - distance),
+            base=_linear_base(p1, p2, distance),
             p1=p1, p2=p2,
             text=text,
-            dimstyle='Standard',
-            override=override_dict,
+            override=_DIM_OVERRIDE,
             layer=mapped_layer
         )
     
+    @register_op('radius')
     def _add_radius_dimension(self, center: Tuple[float, float], radius: float, angle: float = 45, text: str = None) -> Any:
         """添加半径尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
-        override_dict = {'dimdle': 0.5, 'dimexe': 0.5}
-        angle_rad = self._deg2rad(angle)
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
+        angle_rad = _RAD_45 if angle == 45 else math.radians(angle)
         
         return self.canvas.add_radius_dim(
             center=center,
             radius=radius,
             angle=angle_rad,
             text=text,
-            dimstyle='Standard',
-            override=override_dict,
+            override=_DIM_OVERRIDE,
             layer=mapped_layer
         )
     
+    @register_op('diameter')
     def _add_diameter_dimension(self, center: Tuple[float, float], radius: float, angle: float = 45, text: str = None) -> Any:
         """添加直径尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
-        override_dict = {'dimdle': 0.5, 'dimexe': 0.5}
-        angle_rad = self._deg2rad(angle)
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
+        angle_rad = _RAD_45 if angle == 45 else math.radians(angle)
         
         return self.canvas.add_diameter_dim(
             center=center,
             radius=radius,
             angle=angle_rad,
             text=text,
-            dimstyle='Standard',
-            override=override_dict,
+            override=_DIM_OVERRIDE,
             layer=mapped_layer
         )
     
+    @register_op('angular')
     def _add_angular_dimension(self, center: Tuple[float, float], p1: Tuple[float, float], p2: Tuple[float, float], text: str = None) -> Any:
         """添加角度尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
-        override_dict = {'dimdle': 0.5, 'dimexe': 0.5}
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
         
         return self.canvas.add_angular_dim(
             center=center,
             p1=p1,
             p2=p2,
             text=text,
-            dimstyle='Standard',
-            override=override_dict,
+            override=_DIM_OVERRIDE,
             layer=mapped_layer
         )
     
+    @register_op('aligned')
     def _add_aligned_dimension(self, p1: Tuple[float, float], p2: Tuple[float, float], distance: float, text: str = None) -> Any:
         """添加对齐尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
-        override_dict = {'dimdle': 0.5, 'dimexe': 0.5}
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
         
         return self.canvas.add_aligned_dim(
             p1=p1,
             p2=p2,
             distance=distance,
             text=text,
-            dimstyle='Standard',
-            override=override_dict,
+            override=_DIM_OVERRIDE,
             layer=mapped_layer
         )
     
+    @register_op('baseline')
     def _add_baseline_dimensions(self, base_point: Tuple[float, float], points: List[Tuple[float, float]], 
                                 spacing: float = 10, direction: Tuple[float, float] = (1, 0), text: str = None) -> List[Any]:
         """添加基准尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
-        dims = []
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
+        p2s = np.asarray(points, dtype=float)
+        base_points = np.broadcast_to(np.asarray(base_point, dtype=float), p2s.shape)
+        # 每个尺寸线的偏移量递增
+        offsets = (np.arange(len(p2s)) * spacing).tolist()
+        angle = math.degrees(math.atan2(direction[1], direction[0]))
         
-        for i, point in enumerate(points):
-            dim = self.canvas.add_linear_dim(
-                base=base_point,
-                p1=base_point,
-                p2=point,
-                angle=math.atan2(direction[1], direction[0]),
-                dimstyle='Standard',
-                override={
-                    'dimdle': 0.5,
-                    'dimexe': 0.5,
-                    'dimexo': spacing * i  # 每个尺寸线的偏移量递增
-                },
-                layer=mapped_layer
-            )
-            dims.append(dim)
-        return dims
+        return self.canvas.add_linear_dims(
+            base_points, p2s, base_points,
+            text=text,
+            overrides=_offset_overrides(offsets),
+            angle=angle,
+            layer=mapped_layer
+        )
     
+    @register_op('tolerance')
     def _add_dimension_with_tolerance(self, p1: Tuple[float, float], p2: Tuple[float, float], distance: float,
                                      nominal: float, upper_tol: float, lower_tol: float) -> Any:
         """添加带公差的尺寸标注"""
-        mapped_layer = self._get_layer('DIMENSIONS')
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
         
-        # 构建公差文本
-        if upper_tol >= 0:
-            upper_text = f"+{upper_tol}"
-        else:
-            upper_text = f"{upper_tol}"
-            
-        if lower_tol >= 0:
-            lower_text = f"+{lower_tol}"
-        else:
-            lower_text = f"{lower_tol}"
-            
-        tol_text = f"{nominal}{upper_text}/{lower_text}"
+        # 构建公差文本，'+'格式符对非负值补正号
+        tol_text = f"{nominal}{upper_tol:+}/{lower_tol:+}"
         
         return self.canvas.add_linear_dim(
-            base=(min(p1[0], p2[0]), min(p1[1], p2[1]) - distance),
+            base=_linear_base(p1, p2, distance),
             p1=p1, p2=p2,
             text=tol_text,
-            dimstyle='Standard',
-            override={'dimdle': 0.5, 'dimexe': 0.5},
+            override=_DIM_OVERRIDE,
             layer=mapped_layer
-        )
-    
-    def _deg2rad(self, degrees: float) -> float:
-        """度转弧度"""
-        return degrees * math.pi / 180.0
-    
-    def validate_params(self, operation: str, **kwargs) -> bool:
-        """验证尺寸标注参数"""
-        if not super().validate_params(operation, **kwargs):
-            return False
-        
-        # 针对不同操作类型进行特定验证
-        if operation == 'linear':
-            return 'p1' in kwargs and 'p2' in kwargs and 'distance' in kwargs
-        elif operation in ['radius', 'diameter']:
-            return 'center' in kwargs and 'radius' in kwargs and kwargs['radius'] > 0
-        elif operation == 'angular':
-            return 'center' in kwargs and 'p1' in kwargs and 'p2' in kwargs
-        elif operation == 'aligned':
-            return 'p1' in kwargs and 'p2' in kwargs and 'distance' in kwargs
-        elif operation == 'baseline':
-            return 'base_point' in kwargs and 'points' in kwargs and len(kwargs['points']) > 0
-        elif operation == 'tolerance':
-            return ('p1' in kwargs and 'p2' in kwargs and 'distance' in kwargs 
-                    and 'nominal' in kwargs and 'upper_tol' in kwargs and 'lower_tol' in kwargs)
-        
-        return True 
\ No newline at end of file
+        )
\ No newline at end of file
@@ -1,78 +1,75 @@
 import math
+import numpy as np
 from typing import Any, Tuple, List, Optional
-from .base import DrawingStrategy
+from .base import (
+    DrawingStrategy, register_op,
+    LAYER_DIMENSIONS, LAYER_TEXT, LAYER_SURFACE_FINISH, LAYER_TOLERANCE, LAYER_WELD_SYMBOL
+)
+
+
+# 符号轮廓模板，坐标相对于符号定位点，绘制时整体平移
+# 粗糙度符号：竖线、斜线、水平线（符号高宽均为10）
+_ROUGHNESS_TICK = np.array([[0, 0], [0, 6], [4, 10], [10, 10]], dtype=np.float64)
+# 几何公差框（14 x 7）
+_GTOL_BOX = np.array([[0, 0], [14, 0], [14, 7], [0, 7]], dtype=np.float64)
+# 基准框：与公差框共用左边，其余三边
+_GTOL_DATUM = np.array([[14, 0], [21, 0], [21, 7], [14, 7]], dtype=np.float64)
+# 焊接符号箭头（箭头尺寸3）
+_WELD_ARROW = np.array([[3, 3], [0, 0], [3, -3]], dtype=np.float64)
 
 
 class SymbolDrawer(DrawingStrategy):
     """工程符号绘制策略
     
     负责绘制表面粗糙度、几何公差、焊接符号等工程技术符号
+    
+    支持的操作: 'roughness', 'advanced_surface_finish', 'geometric_tolerance', 'welding_symbol',
+    'leader_arrow'
     """
     
-    def draw(self, operation: str, **kwargs) -> Any:
-        """执行工程符号绘制操作
-        
-        Args:
-            operation: 操作类型 ('roughness', 'advanced_surface_finish', 'geometric_tolerance', 'welding_symbol', 'leader_arrow')
-            **kwargs: 操作参数
-            
-        Returns:
-            绘图结果对象
-        """
-        if not self.validate_params(operation, **kwargs):
-            raise ValueError(f"Invalid parameters for operation: {operation}")
-        
-        if operation == 'roughness':
-            return self._add_roughness(**kwargs)
-        elif operation == 'advanced_surface_finish':
-            return self._add_advanced_surface_finish(**kwargs)
-        elif operation == 'geometric_tolerance':
-            return self._add_geometric_tolerance(**kwargs)
-        elif operation == 'welding_symbol':
-            return self._add_welding_symbol(**kwargs)
-        elif operation == 'leader_arrow':
-            return self._add_leader_arrow(**kwargs)
-        else:
-            raise ValueError(f"Unsupported operation: {operation}")
+    __slots__ = ()
+    
+    _PRELOAD_LAYERS = (LAYER_DIMENSIONS, LAYER_TEXT, LAYER_SURFACE_FINISH, LAYER_TOLERANCE, LAYER_WELD_SYMBOL)
     
+    # 各操作的必需参数
+    _REQUIRED_KEYS = {
+        'roughness': frozenset(('position', 'roughness_value')),
+        'advanced_surface_finish': frozenset(('position', 'ra_value')),
+        'geometric_tolerance': frozenset(('position', 'symbol', 'tolerance')),
+        'welding_symbol': frozenset(('position', 'weld_type')),
+        'leader_arrow': frozenset(('start_point', 'end_point', 'text')),
+    }
+    
+    @register_op('roughness')
     def _add_roughness(self, position: Tuple[float, float], roughness_value: str, height: float = 3) -> Any:
         """添加表面粗糙度标注"""
         x, y = position
-        mapped_layer = self._get_layer('DIMENSIONS')
+        mapped_layer = self._get_layer(LAYER_DIMENSIONS)
         
-        # 绘制粗糙度符号
-        # 竖线
-        line1 = self.canvas.add_line((x, y), (x, y + 6), layer=mapped_layer)
-        # 斜线
-        line2 = self.canvas.add_line((x, y + 6), (x + 4, y + 10), layer=mapped_layer)
-        # 水平线
-        line3 = self.canvas.add_line((x + 4, y + 10), (x + 10, y + 10), layer=mapped_layer)
+        # 绘制粗糙度符号：竖线、斜线、水平线连成一条多段线
+        symbol = self.canvas.add_lwpolyline((_ROUGHNESS_TICK + (x, y)).tolist(), closed=False, layer=mapped_layer)
         
         # 添加粗糙度值
-        text_layer = self._get_layer('TEXT')
+        text_layer = self._get_layer(LAYER_TEXT)
         text = self.canvas.add_text(f"Ra{roughness_value}", (x + 15, y + 10), height=height, layer=text_layer)
         
-        return [line1, line2, line3, text]
+        return [symbol, text]
     
+    @register_op('advanced_surface_finish')
     def _add_advanced_surface_finish(self, position: Tuple[float, float], ra_value: str, 
                                    machining_method: str = None, waviness: str = None, 
                                    lay: str = None, cutoff: str = None, height: float = 2.5) -> Any:
         """添加高级表面粗糙度标注 (符合GB/T 131 标准)"""
         x, y = position
-        mapped_layer = self._get_layer('SURFACE_FINISH')
+        mapped_layer = self._get_layer(LAYER_SURFACE_FINISH)
         
         # 符号大小
         sym_height = 10
         sym_width = 10
         
         # 基本符号 - 符合GB/T 131标准的粗糙度符号
-        lines = []
-        # 竖线
-        lines.append(self.canvas.add_line((x, y), (x, y + sym_height * 0.6), layer=mapped_layer))
-        # 斜线
-        lines.append(self.canvas.add_line((x, y + sym_height * 0.6), (x + sym_width * 0.4, y + sym_height), layer=mapped_layer))
-        # 水平线
-        lines.append(self.canvas.add_line((x + sym_width * 0.4, y + sym_height), (x + sym_width, y + sym_height), layer=mapped_layer))
+        # 竖线、斜线、水平线连成一条多段线
+        lines = [self.canvas.add_lwpolyline((_ROUGHNESS_TICK + (x, y)).tolist(), closed=False, layer=mapped_layer)]
         
         # 绘制加工方法指示（顶部水平线）
         if machining_method:
@@ -102,28 +99,23 @@ class SymbolDrawer(DrawingStrategy):
         
         return lines
     
+    @register_op('geometric_tolerance')
     def _add_geometric_tolerance(self, position: Tuple[float, float], symbol: str, tolerance: str, 
                                datum: str = None, height: float = 2.5) -> Any:
         """添加几何公差框"""
         x, y = position
-        mapped_layer = self._get_layer('TOLERANCE')
+        mapped_layer = self._get_layer(LAYER_TOLERANCE)
         
         # 绘制公差框
         box_width = 14
         box_height = 7
         
-        lines = []
-        # 框框矩形
-        lines.append(self.canvas.add_line((x, y), (x + box_width, y), layer=mapped_layer))
-        lines.append(self.canvas.add_line((x + box_width, y), (x + box_width, y + box_height), layer=mapped_layer))
-        lines.append(self.canvas.add_line((x + box_width, y + box_height), (x, y + box_height), layer=mapped_layer))
-        lines.append(self.canvas.add_line((x, y + box_height), (x, y), layer=mapped_layer))
+        # 框框矩形，作为一条闭合轻量多段线
+        lines = [self.canvas.add_lwpolyline((_GTOL_BOX + (x, y)).tolist(), closed=True, layer=mapped_layer)]
         
-        # 如果有基准，添加基准框
+        # 如果有基准，添加基准框（与公差框共用左边，其余三边为一条多段线）
         if datum:
-            lines.append(self.canvas.add_line((x + box_width, y), (x + box_width + 7, y), layer=mapped_layer))
-            lines.append(self.canvas.add_line((x + box_width + 7, y), (x + box_width + 7, y + box_height), layer=mapped_layer))
-            lines.append(self.canvas.add_line((x + box_width + 7, y + box_height), (x + box_width, y + box_height), layer=mapped_layer))
+            lines.append(self.canvas.add_lwpolyline((_GTOL_DATUM + (x, y)).tolist(), layer=mapped_layer))
             
             # 添加基准文字
             lines.append(self.canvas.add_text(datum, (x + box_width + 3.5, y + box_height/2), height=height, layer=mapped_layer))
@@ -134,12 +126,13 @@ class SymbolDrawer(DrawingStrategy):
         
         return lines
     
+    @register_op('welding_symbol')
     def _add_welding_symbol(self, position: Tuple[float, float], weld_type: str, size: str = None, 
                            length: str = None, process: str = None, finish: str = None, 
                            field: bool = False, height: float = 2.5) -> Any:
         """添加焊接符号"""
         x, y = position
-        mapped_layer = self._get_layer('WELD_SYMBOL')
+        mapped_layer = self._get_layer(LAYER_WELD_SYMBOL)
         
         # 符号基本尺寸
         sym_length = 30
@@ -148,10 +141,8 @@ class SymbolDrawer(DrawingStrategy):
         # 主引出线
         elements.append(self.canvas.add_line((x, y), (x + sym_length, y), layer=mapped_layer))
         
-        # 箭头
-        arrow_size = 3
-        elements.append(self.canvas.add_line((x, y), (x + arrow_size, y + arrow_size), layer=mapped_layer))
-        elements.append(self.canvas.add_line((x, y), (x + arrow_size, y - arrow_size), layer=mapped_layer))
+        # 箭头，两条箭头边经过端点连成一条多段线
+        elements.append(self.canvas.add_lwpolyline((_WELD_ARROW + (x, y)).tolist(), closed=False, layer=mapped_layer))
         
         # 如果是现场焊接，添加标记
         flag_height = 5
@@ -167,69 +158,64 @@ class SymbolDrawer(DrawingStrategy):
         elements.append(self.canvas.add_text(weld_type, (sym_x, sym_y), height=height, layer=mapped_layer))
         
         # 添加尺寸信息（如有）
-        info_text = ""
-        if size:
-            info_text += f"{size}"
-        if length:
-            if info_text:
-                info_text += "-"
-            info_text += f"{length}"
-        
-        if info_text:
+        if size or length:
+            info_text = "-".join(str(v) for v in (size, length) if v)
             elements.append(self.canvas.add_text(info_text, (sym_x, y - 3), height=height, layer=mapped_layer))
         
         # 添加工艺信息（如有）
         if process or finish:
-            proc_text = ""
-            if process:
-                proc_text += f"{process}"
-            if finish:
-                if proc_text:
-                    proc_text += ", "
-                proc_text += f"{finish}"
-            
+            proc_text = ", ".join(str(v) for v in (process, finish) if v)
             elements.append(self.canvas.add_text(proc_text, (x + sym_length * 0.5, y - 6), height=height * 0.8, layer=mapped_layer))
         
         return elements
     
+    @register_op('leader_arrow')
     def _add_leader_arrow(self, start_point: Tuple[float, float], end_point: Tuple[float, float], text: str) -> Any:
         """添加引出线和文本标注"""
-        mapped_dimensions_layer = self._get_layer('DIMENSIONS')
-        mapped_text_layer = self._get_layer('TEXT')
+        mapped_dimensions_layer = self._get_layer(LAYER_DIMENSIONS)
+        mapped_text_layer = self._get_layer(LAYER_TEXT)
+        
+        # 坐标一次解包为局部变量，后续计算不再索引元组
+        sx, sy = start_point
+        ex, ey = end_point
+        add_line = self.canvas.add_line
         
         # 计算箭头方向向量，用于延长引出线
-        dx = end_point[0] - start_point[0]
-        dy = end_point[1] - start_point[1]
+        dx = ex - sx
+        dy = ey - sy
         
         height = 3.5
         
-        # 计算距离
-        dist = math.sqrt(dx*dx + dy*dy)
-        
-        # 规范化向量
-        if dist > 0:
-            dx = dx / dist
-            dy = dy / dist
+        # 计算距离并规范化向量
+        dist = math.hypot(dx, dy)
+        inv = 1.0 / dist if dist > 0 else 0.0
+        dx *= inv
+        dy *= inv
         
         # 延长引出线 - 在start_point方向延长20%
         extension_factor = 0.2
-        extended_start_x = start_point[0] - dx * dist * extension_factor
-        extended_start_y = start_point[1] - dy * dist * extension_factor
+        ext = dist * extension_factor
+        extended_start_x = sx - dx * ext
+        extended_start_y = sy - dy * ext
         extended_start = (extended_start_x, extended_start_y)
         
         elements = []
         # 创建延长的引出线
-        elements.append(self.canvas.add_line(end_point, extended_start, layer=mapped_dimensions_layer))
+        elements.append(add_line(end_point, extended_start, layer=mapped_dimensions_layer))
         
         # 检查原始引出线是否已经是水平的
         is_horizontal = abs(dy) < 0.05  # 如果y方向差异很小，认为是水平线
         
-        if not is_horizontal:
-            # 修改后的引线实现 - 添加更长的水平线段以延伸到视图外部
-            horizontal_length = 10  # 足够长的水平线段
+        if is_horizontal:
+            # 已经是水平线时，文字沿引出线方向只需少量偏移
+            horizontal_length = 1
+            horiz_direction = 1 if sx < ex else -1
+        else:
+            # 添加更长的水平线段以延伸到视图外部
+            horizontal_length = 10
             
             # 计算end_point到start_point的方向
-            view_direction_x = start_point[0] - end_point[0]
+            view_direction_x = sx - ex
             
             # 确定水平线段的方向（向左或向右）
             if abs(view_direction_x) > 10:  # 有明显的水平偏移
@@ -237,58 +223,21 @@ class SymbolDrawer(DrawingStrategy):
             else:
                 # 如果引出线几乎垂直，则根据大概的视图位置判断
                 horiz_direction = -1 if dx > 0 else 1
-            
-            # 水平线段的终点
-            horiz_end_x = extended_start_x + horizontal_length * horiz_direction
-            horiz_end_y = extended_start_y
-            horiz_end = (horiz_end_x, horiz_end_y)
-            
-            # 添加水平线段
-            elements.append(self.canvas.add_line(extended_start, horiz_end, layer=mapped_dimensions_layer))
-            
-            # 文本位置在水平线段的终点附近
-            text_offset = 5  # 文本偏移量
-            text_point = (horiz_end_x + text_offset * horiz_direction, horiz_end_y)
-        else:
-            # 对于已经是水平线的情况，只需要在现有线段的基础上延长
-            horiz_direction = 1 if start_point[0] < end_point[0] else -1
-            
-            # 额外的延长长度
-            extra_length = 1  # 固定延长长度
-            
-            # 计算延长后的终点
-            horiz_end_x = extended_start_x + extra_length * horiz_direction
-            horiz_end_y = extended_start_y
-            horiz_end = (horiz_end_x, horiz_end_y)
-            
-            # 添加延长的水平线段
-            elements.append(self.canvas.add_line(extended_start, horiz_end, layer=mapped_dimensions_layer))
-            
-            # 文本位置在延长线的终点附近
-            text_offset = 5  # 文本偏移量
-            text_point = (horiz_end_x + text_offset * horiz_direction, horiz_end_y)
+        
+        # 水平线段的终点
+        horiz_end_x = extended_start_x + horizontal_length * horiz_direction
+        
+        # 水平引出线上的1单位延长段与引出线本身重合，只为倾斜引出线添加水平线段
+        if not is_horizontal:
+            elements.append(add_line(extended_start, (horiz_end_x, extended_start_y), 
+                                     layer=mapped_dimensions_layer))
+        
+        # 文本位置在水平线段的终点附近
+        text_offset = 5  # 文本偏移量
+        text_point = (horiz_end_x + text_offset * horiz_direction, extended_start_y)
         
         # 添加文本
         elements.append(self.canvas.add_text(text, text_point, height=height, layer=mapped_text_layer, 
                                            halign=1, valign=2))
         
-        return elements
-    
-    def validate_params(self, operation: str, **kwargs) -> bool:
-        """验证工程符号参数"""
-        if not super().validate_params(operation, **kwargs):
-            return False
-        
-        # 针对不同操作类型进行特定验证
-        if operation == 'roughness':
-            return 'position' in kwargs and 'roughness_value' in kwargs
-        elif operation == 'advanced_surface_finish':
-            return 'position' in kwargs and 'ra_value' in kwargs
-        elif operation == 'geometric_tolerance':
-            return 'position' in kwargs and 'symbol' in kwargs and 'tolerance' in kwargs
-        elif operation == 'welding_symbol':
-            return 'position' in kwargs and 'weld_type' in kwargs
-        elif operation == 'leader_arrow':
-            return 'start_point' in kwargs and 'end_point' in kwargs and 'text' in kwargs
-        
-        return True 
\ No newline at end of file
+        return elements
\ No newline at end of file
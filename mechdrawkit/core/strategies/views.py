@@ -1,189 +1,258 @@
-import math
+from math import hypot
+from functools import lru_cache
+import numpy as np
 from typing import Any, Tuple, List, Optional
-from .base import DrawingStrategy
+from .base import DrawingStrategy, register_op, LAYER_CUTTING_PLANE, LAYER_DETAIL, LAYER_TEXT, LINETYPE_CENTER
+
+
+# 文本宽度估算：每个字符宽度相对字高的比例
+_WIDTH_CJK = 1.0
+_WIDTH_ASCII = 0.6
+
+
+@lru_cache(maxsize=256)
+def _est_width(text: str, height: float) -> float:
+    """估算单行文本宽度，中日韩字符按全角计，其余按半角计"""
+    return height * sum(_WIDTH_CJK if 0x3000 <= ord(c) <= 0x9fff else _WIDTH_ASCII for c in text)
 
 
 class ViewDrawer(DrawingStrategy):
     """视图处理绘制策略
     
     负责绘制剖面指示线、剖视图标签、局部放大图等视图相关功能
+    
+    支持的操作: 'section_line', 'section_lines', 'section_view_label', 'detail_view', 'detail_views', 'text'
     """
     
-    def draw(self, operation: str, **kwargs) -> Any:
-        """执行视图处理绘制操作
-        
-        Args:
-            operation: 操作类型 ('section_line', 'section_view_label', 'detail_view', 'text')
-            **kwargs: 操作参数
-            
-        Returns:
-            绘图结果对象
-        """
-        if not self.validate_params(operation, **kwargs):
-            raise ValueError(f"Invalid parameters for operation: {operation}")
-        
-        if operation == 'section_line':
-            return self._add_section_line(**kwargs)
-        elif operation == 'section_view_label':
-            return self._add_section_view_label(**kwargs)
-        elif operation == 'detail_view':
-            return self._add_detail_view(**kwargs)
-        elif operation == 'text':
-            return self._add_text(**kwargs)
-        else:
-            raise ValueError(f"Unsupported operation: {operation}")
+    __slots__ = ()
+    
+    _PRELOAD_LAYERS = (LAYER_CUTTING_PLANE, LAYER_TEXT, LAYER_DETAIL)
+    
+    # 各操作的必需参数
+    _REQUIRED_KEYS = {
+        'section_line': frozenset(('start_point', 'end_point')),
+        'section_lines': frozenset(('starts', 'ends')),
+        'section_view_label': frozenset(('position',)),
+        'detail_view': frozenset(('center', 'radius')),
+        'detail_views': frozenset(('centers', 'radii')),
+        'text': frozenset(('text', 'position')),
+    }
     
+    # 各操作的参数数值检查
+    _NUMERIC_CHECKS = {
+        'section_lines': lambda kw: len(kw['starts']) == len(kw['ends']),
+        'detail_view': lambda kw: kw['radius'] > 0,
+        'detail_views': lambda kw: bool(np.all(np.asarray(kw['radii']) > 0)),
+    }
+    
+    @register_op('section_line')
     def _add_section_line(self, start_point: Tuple[float, float], end_point: Tuple[float, float], 
                          section_label: str = "A", arrow_size: float = 3) -> Any:
         """添加剖面指示线"""
-        mapped_layer = self._get_layer('CUTTING_PLANE')
+        mapped_layer = self._get_layer(LAYER_CUTTING_PLANE)
         
         # 计算方向向量
-        dx = end_point[0] - start_point[0]
-        dy = end_point[1] - start_point[1]
-        length = math.sqrt(dx*dx + dy*dy)
+        sx, sy = start_point
+        ex, ey = end_point
+        dx = ex - sx
+        dy = ey - sy
         
-        elements = []
+        # 长度为0时不绘制
+        if not (dx or dy):
+            return []
         
-        if length > 0:
-            # 单位向量
-            dx /= length
-            dy /= length
-            
-            # 法向量（垂直于方向向量）
-            nx = -dy
-            ny = dx
-            
-            # 箭头在单位向量方向上偏移
-            arrow_offset = 5  # 箭头偏移量
-            
-            # 计算箭头位置
-            arrow1_center = (
-                start_point[0] + arrow_offset * dx,
-                start_point[1] + arrow_offset * dy
-            )
-            
-            arrow2_center = (
-                end_point[0] - arrow_offset * dx,
-                end_point[1] - arrow_offset * dy
-            )
-            
-            # 绘制主线
-            elements.append(self.canvas.add_line(start_point, end_point, layer=mapped_layer, linetype='CENTER'))
-            
-            # 绘制第一个箭头
-            elements.append(self.canvas.add_line(
-                (arrow1_center[0] - arrow_size * dx + arrow_size * nx, 
-                 arrow1_center[1] - arrow_size * dy + arrow_size * ny),
-                arrow1_center,
-                layer=mapped_layer
-            ))
-            elements.append(self.canvas.add_line(
-                (arrow1_center[0] - arrow_size * dx - arrow_size * nx, 
-                 arrow1_center[1] - arrow_size * dy - arrow_size * ny),
-                arrow1_center,
-                layer=mapped_layer
-            ))
-            
-            # 绘制第二个箭头（方向相反）
-            elements.append(self.canvas.add_line(
-                (arrow2_center[0] + arrow_size * dx + arrow_size * nx, 
-                 arrow2_center[1] + arrow_size * dy + arrow_size * ny),
-                arrow2_center,
-                layer=mapped_layer
-            ))
-            elements.append(self.canvas.add_line(
-                (arrow2_center[0] + arrow_size * dx - arrow_size * nx, 
-                 arrow2_center[1] + arrow_size * dy - arrow_size * ny),
-                arrow2_center,
-                layer=mapped_layer
-            ))
-            
-            # 添加剖面标识 - 在两端
-            text_offset = 8
-            elements.append(self.canvas.add_text(
-                f"{section_label}-{section_label}", 
-                (start_point[0] - text_offset * dx, start_point[1] - text_offset * dy),
-                height=5,
-                layer=mapped_layer
-            ))
+        # 单位向量
+        inv_length = 1.0 / hypot(dx, dy)
+        dx *= inv_length
+        dy *= inv_length
+        
+        # 法向量（垂直于方向向量）
+        nx = -dy
+        ny = dx
+        
+        # 箭头在单位向量方向上偏移
+        arrow_offset = 5  # 箭头偏移量
+        
+        # 计算箭头位置
+        arrow1_center = (sx + arrow_offset * dx, sy + arrow_offset * dy)
+        arrow2_center = (ex - arrow_offset * dx, ey - arrow_offset * dy)
+        
+        # 主线为点划线，单独绘制
+        canvas = self.canvas
+        elements = [canvas.add_line(start_point, end_point, layer=mapped_layer, linetype=LINETYPE_CENTER)]
+        
+        # 箭头偏移分量，以及两个箭头（第二个方向相反）两条边的公共端点
+        ax = arrow_size * dx
+        ay = arrow_size * dy
+        nxs = arrow_size * nx
+        nys = arrow_size * ny
+        a1x = arrow1_center[0] - ax
+        a1y = arrow1_center[1] - ay
+        a2x = arrow2_center[0] + ax
+        a2y = arrow2_center[1] + ay
+        
+        # 两个箭头的四条边一次绘制
+        elements.extend(canvas.add_lines_batch((
+            ((a1x + nxs, a1y + nys), arrow1_center),
+            ((a1x - nxs, a1y - nys), arrow1_center),
+            ((a2x + nxs, a2y + nys), arrow2_center),
+            ((a2x - nxs, a2y - nys), arrow2_center),
+        ), layer=mapped_layer))
+        
+        # 添加剖面标识 - 在两端
+        text_offset = 8
+        tdx = text_offset * dx
+        tdy = text_offset * dy
+        label = f"{section_label}-{section_label}"
+        elements.extend(canvas.add_texts_batch(
+            (label, label),
+            ((sx - tdx, sy - tdy), (ex + tdx, ey + tdy)),
+            height=5,
+            layer=mapped_layer
+        ))
+        
+        return elements
+    
+    @register_op('section_lines')
+    def _add_section_lines_batch(self, starts, ends, labels: Optional[List[str]] = None, 
+                                 arrow_size: float = 3) -> List[Any]:
+        """批量添加剖面指示线
+        
+        几何与 _add_section_line 相同，用numpy一次计算所有剖面线的方向、箭头和标识位置
+        
+        Args:
+            starts: (N, 2) 起点数组
+            ends: (N, 2) 终点数组
+            labels: 各剖面线的标识字母，默认均为 "A"
+            arrow_size: 箭头尺寸
             
-            elements.append(self.canvas.add_text(
-                f"{section_label}-{section_label}", 
-                (end_point[0] + text_offset * dx, end_point[1] + text_offset * dy),
-                height=5,
-                layer=mapped_layer
-            ))
+        Returns:
+            元素列表，依次为全部主线、全部箭头线、全部标识文本；长度为0的剖面线跳过
             
+        Raises:
+            ValueError: 当标识数量与剖面线数量不一致时
+        """
+        mapped_layer = self._get_layer(LAYER_CUTTING_PLANE)
+        
+        starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+        if labels is None:
+            labels = ["A"] * len(starts)
+        elif len(labels) != len(starts):
+            raise ValueError(f"Expected {len(starts)} section labels, got {len(labels)}")
+        
+        # 计算方向向量，跳过长度为0的剖面线
+        d = ends - starts
+        length = np.hypot(d[:, 0], d[:, 1])
+        valid = length > 0
+        if not valid.all():
+            starts, ends, d, length = starts[valid], ends[valid], d[valid], length[valid]
+            labels = [label for label, keep in zip(labels, valid) if keep]
+        if not len(starts):
+            return []
+        
+        # 单位向量与法向量
+        u = d / length[:, None]
+        n = np.column_stack((-u[:, 1], u[:, 0]))
+        
+        # 箭头位置（偏移量5）与箭头偏移分量
+        c1 = starts + 5 * u
+        c2 = ends - 5 * u
+        au = arrow_size * u
+        an = arrow_size * n
+        
+        canvas = self.canvas
+        elements = canvas.add_lines_batch(
+            np.stack((starts, ends), axis=1).tolist(), layer=mapped_layer, linetype=LINETYPE_CENTER
+        )
+        
+        # 每条剖面线的四条箭头边 -> (N*4, 2, 2)
+        arrows = np.stack((c1 - au + an, c1, c1 - au - an, c1,
+                           c2 + au + an, c2, c2 + au - an, c2), axis=1).reshape(-1, 2, 2)
+        elements.extend(canvas.add_lines_batch(arrows.tolist(), layer=mapped_layer))
+        
+        # 两端的剖面标识（偏移量8）
+        positions = np.stack((starts - 8 * u, ends + 8 * u), axis=1).reshape(-1, 2)
+        texts = []
+        for label in labels:
+            text = f"{label}-{label}"
+            texts += (text, text)
+        elements.extend(canvas.add_texts_batch(texts, positions.tolist(), height=5, layer=mapped_layer))
+        
         return elements
     
+    @register_op('section_view_label')
     def _add_section_view_label(self, position: Tuple[float, float], section_label: str = "A-A", height: float = 5) -> Any:
         """添加剖视图标签"""
-        mapped_layer = self._get_layer('TEXT')
+        mapped_layer = self._get_layer(LAYER_TEXT)
         
-        # 创建标签文本
+        # 创建标签文本，下划线长度按估算的文本宽度
         text = f"剖视图 {section_label}"
         
-        elements = []
-        text_obj = self.canvas.add_text(text, position, height=height, layer=mapped_layer)
-        elements.append(text_obj)
-        
-        # 添加下划线
-        x, y = position
-        text_length = len(text) * height * 0.6  # 估算文本长度
-        underline = self.canvas.add_line(
-            (x - text_length/2, y - height*0.8),
-            (x + text_length/2, y - height*0.8),
-            layer=mapped_layer
-        )
-        elements.append(underline)
-        
-        return elements
+        return list(self.canvas.add_underlined_text(text, position, _est_width(text, height), 
+                                                    height=height, layer=mapped_layer))
     
+    @register_op('detail_view')
     def _add_detail_view(self, center: Tuple[float, float], radius: float, 
                         detail_label: str = "B", scale: str = "2:1") -> Any:
         """添加局部放大图指示"""
-        mapped_layer = self._get_layer('DETAIL')
+        mapped_layer = self._get_layer(LAYER_DETAIL)
+        canvas = self.canvas
+        cx, cy = center
+        label_offset = radius * 1.2
         
-        elements = []
+        return [
+            # 绘制圆
+            canvas.add_circle(center, radius, layer=mapped_layer),
+            # 添加放大图标识
+            canvas.add_text(detail_label, (cx, cy + label_offset), height=5, layer=mapped_layer),
+            # 添加比例文本
+            canvas.add_text(scale, (cx, cy - label_offset), height=3.5, layer=mapped_layer),
+        ]
+    
+    @register_op('detail_views')
+    def _add_detail_views_batch(self, centers, radii, labels: Optional[List[str]] = None, 
+                                scales: Optional[List[str]] = None) -> List[Any]:
+        """批量添加局部放大图指示
         
-        # 绘制圆
-        circle = self.canvas.add_circle(center, radius, layer=mapped_layer)
-        elements.append(circle)
+        Args:
+            centers: (N, 2) 圆心数组
+            radii: 半径，标量或长度为N的数组
+            labels: 各放大图标识，默认均为 "B"
+            scales: 各放大图比例，默认均为 "2:1"
+            
+        Returns:
+            元素列表，依次为全部圆、全部标识文本、全部比例文本
+        """
+        mapped_layer = self._get_layer(LAYER_DETAIL)
         
-        # 添加放大图标识
-        label_text = self.canvas.add_text(detail_label, (center[0], center[1] + radius*1.2), height=5, layer=mapped_layer)
-        elements.append(label_text)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 2)
+        n = len(centers)
+        radii = np.broadcast_to(np.asarray(radii, dtype=float), (n,))
+        if labels is None:
+            labels = ["B"] * n
+        if scales is None:
+            scales = ["2:1"] * n
         
-        # 添加比例文本
-        scale_text = self.canvas.add_text(scale, (center[0], center[1] - radius*1.2), height=3.5, layer=mapped_layer)
-        elements.append(scale_text)
+        # 标识位于圆上方、比例位于圆下方1.2倍半径处
+        label_offset = radii * 1.2
+        label_pos = centers.copy()
+        label_pos[:, 1] += label_offset
+        scale_pos = centers.copy()
+        scale_pos[:, 1] -= label_offset
         
+        canvas = self.canvas
+        elements = canvas.add_circles_batch(centers.tolist(), radii.tolist(), layer=mapped_layer)
+        elements.extend(canvas.add_texts_batch(labels, label_pos.tolist(), height=5, layer=mapped_layer))
+        elements.extend(canvas.add_texts_batch(scales, scale_pos.tolist(), height=3.5, layer=mapped_layer))
         return elements
     
+    @register_op('text')
     def _add_text(self, text: str, position: Tuple[float, float], height: float = 2.5, 
-                 layer: str = 'TEXT', style: str = 'chinese', valign: int = 1, halign: int = 1) -> Any:
+                 layer: str = LAYER_TEXT, style: str = 'chinese', valign: int = 1, halign: int = 1) -> Any:
         """添加文本"""
-        x, y = position
         mapped_layer = self._get_layer(layer)
         
-        text_obj = self.canvas.add_text(text, position=(x, y), height=height, layer=mapped_layer, 
+        text_obj = self.canvas.add_text(text, position=position, height=height, layer=mapped_layer, 
                                        style=style, valign=valign, halign=halign)
-        return text_obj
-    
-    def validate_params(self, operation: str, **kwargs) -> bool:
-        """验证视图处理参数"""
-        if not super().validate_params(operation, **kwargs):
-            return False
-        
-        # 针对不同操作类型进行特定验证
-        if operation == 'section_line':
-            return 'start_point' in kwargs and 'end_point' in kwargs
-        elif operation == 'section_view_label':
-            return 'position' in kwargs
-        elif operation == 'detail_view':
-            return 'center' in kwargs and 'radius' in kwargs and kwargs['radius'] > 0
-        elif operation == 'text':
-            return 'text' in kwargs and 'position' in kwargs
-        
-        return True 
\ No newline at end of file
+        return text_obj
\ No newline at end of file
@@ -1,16 +1,32 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
 from typing import Any, Dict, Optional, Tuple
 from .factory import ComponentFactory
 from .adapters import EzdxfAdapter
+from ._geom import shaft_layout
 from ..config.gb_standards import GBStandardConfig
 
 
+# 绘图规格：((策略属性名, 操作名, 参数字典), ...)，坐标相对于模板原点
+DrawSpec = Tuple[Tuple[str, str, Dict[str, Any]], ...]
+
+# 需要按原点平移的坐标参数
+_POINT_KEYS = frozenset(('lower_left', 'start', 'end', 'center', 'p1', 'p2'))
+# 需要按原点平移的线段序列参数
+_SEGMENT_KEYS = frozenset(('segments',))
+
+
 class DrawingTemplate(ABC):
     """绘图模板抽象基类
     
     实现模板方法模式，定义标准绘图流程
     """
     
+    __slots__ = ('msp', 'doc', 'config', 'canvas', 'basic_shapes', 'dimensions', 'symbols', 'views',
+                 '_draw_methods', '_params', '_params_kwargs')
+    
     def __init__(self, msp, doc, config_manager: GBStandardConfig = None):
         """初始化绘图模板
         
@@ -29,12 +45,29 @@ class DrawingTemplate(ABC):
         self.dimensions = ComponentFactory.create_strategy('dimensions', self.canvas, self.config)
         self.symbols = ComponentFactory.create_strategy('symbols', self.canvas, self.config)
         self.views = ComponentFactory.create_strategy('views', self.canvas, self.config)
+        
+        # 策略属性名 -> 绑定的绘制方法，供 _emit 直接调用；
+        # 模板参数在 _parse_params 中已验证，规格内的操作跳过逐项参数验证
+        self._draw_methods = {
+            'basic_shapes': self.basic_shapes.draw_unchecked,
+            'dimensions': self.dimensions.draw_unchecked,
+            'symbols': self.symbols.draw_unchecked,
+            'views': self.views.draw_unchecked,
+        }
+        
+        # 最近一次解析的模板参数及其对应的关键字参数，见 _resolve_params
+        self._params = None
+        self._params_kwargs = None
     
     def generate_drawing(self, **kwargs) -> Any:
         """生成图纸 - 模板方法
         
         定义标准绘图流程，子类通过重写抽象方法实现具体功能
         """
+        # 模板参数在入口处一次性解析并验证，各步骤收到相同参数时直接复用
+        self._params = self._parse_params(**kwargs)
+        self._params_kwargs = kwargs
+        
         # 1. 设置文档
         self._setup_document(**kwargs)
         
@@ -61,6 +94,27 @@ class DrawingTemplate(ABC):
         
         return self.doc
     
+    def _emit(self, spec: DrawSpec, origin: Tuple[float, float]):
+        """将相对原点的绘图规格平移到origin后逐项绘制
+        
+        Args:
+            spec: 绘图规格，由缓存的规格函数生成，只读
+            origin: 模板原点
+        """
+        ox, oy = origin
+        draw_methods = self._draw_methods
+        point_keys = _POINT_KEYS
+        segment_keys = _SEGMENT_KEYS
+        for strategy_name, operation, params in spec:
+            kwargs = {}
+            for key, value in params.items():
+                if key in point_keys:
+                    value = (value[0] + ox, value[1] + oy)
+                elif key in segment_keys:
+                    value = [((x1 + ox, y1 + oy), (x2 + ox, y2 + oy)) for (x1, y1), (x2, y2) in value]
+                kwargs[key] = value
+            draw_methods[strategy_name](operation, **kwargs)
+    
     def _setup_document(self, **kwargs):
         """设置文档 - 默认实现"""
         # 文档设置已在EzdxfAdapter中完成
@@ -76,6 +130,35 @@ class DrawingTemplate(ABC):
         # 可以在具体模板中重写以设置特定的视图布局
         pass
     
+    def _parse_params(self, **kwargs) -> Any:
+        """解析并验证模板参数 - 默认实现
+        
+        子类可重写为返回参数对象，各步骤通过 _resolve_params 取用
+        
+        Returns:
+            模板参数对象；默认返回关键字参数字典
+            
+        Raises:
+            ValueError: 当参数无效时
+        """
+        return kwargs
+    
+    def _resolve_params(self, kwargs: Dict[str, Any]) -> Any:
+        """获取步骤关键字参数对应的模板参数对象
+        
+        与 generate_drawing 解析时的参数相同时复用解析结果，
+        子类以修改后的参数调用步骤时重新解析
+        
+        Args:
+            kwargs: 步骤收到的关键字参数
+            
+        Returns:
+            _parse_params 返回的模板参数对象
+        """
+        if self._params_kwargs is None or kwargs != self._params_kwargs:
+            return self._parse_params(**kwargs)
+        return self._params
+    
     @abstractmethod
     def _draw_main_view(self, **kwargs):
         """绘制主视图 - 抽象方法，必须由子类实现"""
@@ -102,51 +185,162 @@ class DrawingTemplate(ABC):
         pass
 
 
+@lru_cache(maxsize=128)
+def _shaft_main_spec(diameter: float, length: float) -> DrawSpec:
+    """轴主视图规格：外轮廓和中心线"""
+    hl = length * 0.5
+    hd = diameter * 0.5
+    return (
+        ('basic_shapes', 'rectangle', {'lower_left': (-hl, -hd),
+                                       'width': length, 'height': diameter, 'layer': 'PARTS'}),
+        ('basic_shapes', 'centerline', {'start': (-hl - 10, 0), 'end': (hl + 10, 0)}),
+    )
+
+
+@lru_cache(maxsize=128)
+def _shaft_auxiliary_spec(diameter: float) -> DrawSpec:
+    """轴左视图规格：位于原点左侧80处的圆形视图及其中心线"""
+    view_x = -80
+    hd = diameter * 0.5
+    return (
+        ('basic_shapes', 'circle', {'center': (view_x, 0), 'radius': hd, 'layer': 'PARTS'}),
+        ('basic_shapes', 'centerlines', {'segments': (
+            ((view_x - hd - 5, 0), (view_x + hd + 5, 0)),
+            ((view_x, -hd - 5), (view_x, hd + 5)),
+        )}),
+    )
+
+
+@lru_cache(maxsize=128)
+def _shaft_dimension_spec(diameter: float, length: float) -> DrawSpec:
+    """轴尺寸标注规格：长度和直径"""
+    hl = length * 0.5
+    hd = diameter * 0.5
+    return (
+        ('dimensions', 'linear', {'p1': (-hl, -hd), 'p2': (hl, -hd), 'distance': 15}),
+        ('dimensions', 'diameter', {'center': (-80, 0), 'radius': hd, 'angle': 45}),
+    )
+
+
+@lru_cache(maxsize=128)
+def _gear_main_spec(outer_diameter: float, inner_diameter: float) -> DrawSpec:
+    """齿轮主视图规格：外圆、内孔和中心线"""
+    ho = outer_diameter * 0.5
+    return (
+        ('basic_shapes', 'circle', {'center': (0, 0), 'radius': ho, 'layer': 'PARTS'}),
+        ('basic_shapes', 'circle', {'center': (0, 0), 'radius': inner_diameter * 0.5, 'layer': 'PARTS'}),
+        ('basic_shapes', 'centerlines', {'segments': (
+            ((-ho - 10, 0), (ho + 10, 0)),
+            ((0, -ho - 10), (0, ho + 10)),
+        )}),
+    )
+
+
+@lru_cache(maxsize=128)
+def _gear_auxiliary_spec(thickness: float, outer_diameter: float) -> DrawSpec:
+    """齿轮侧视图规格：位于原点右侧80处的矩形及中心线"""
+    view_x = 80
+    ho = outer_diameter * 0.5
+    return (
+        ('basic_shapes', 'rectangle', {'lower_left': (view_x - thickness * 0.5, -ho),
+                                       'width': thickness, 'height': outer_diameter, 'layer': 'PARTS'}),
+        ('basic_shapes', 'centerline', {'start': (view_x, -ho - 10), 'end': (view_x, ho + 10)}),
+    )
+
+
+@lru_cache(maxsize=128)
+def _gear_dimension_spec(outer_diameter: float, inner_diameter: float) -> DrawSpec:
+    """齿轮尺寸标注规格：外径和内径"""
+    return (
+        ('dimensions', 'diameter', {'center': (0, 0), 'radius': outer_diameter * 0.5, 'angle': 45}),
+        ('dimensions', 'diameter', {'center': (0, 0), 'radius': inner_diameter * 0.5, 'angle': 135}),
+    )
+
+
+@dataclass(frozen=True)
+class _ShaftParams:
+    """轴模板参数"""
+    origin: Tuple[float, float] = (0, 0)
+    diameter: float = 20
+    length: float = 100
+    
+    def __post_init__(self):
+        if not (self.diameter > 0 and self.length > 0):
+            raise ValueError(f"Invalid shaft parameters: diameter={self.diameter}, length={self.length}")
+
+
+@dataclass(frozen=True)
+class _GearParams:
+    """齿轮模板参数"""
+    origin: Tuple[float, float] = (0, 0)
+    outer_diameter: float = 60
+    inner_diameter: float = 20
+    thickness: float = 15
+    
+    def __post_init__(self):
+        if not (self.outer_diameter > 0 and self.inner_diameter > 0 and self.thickness > 0):
+            raise ValueError(f"Invalid gear parameters: outer_diameter={self.outer_diameter}, "
+                             f"inner_diameter={self.inner_diameter}, thickness={self.thickness}")
+
+
 class ShaftTemplate(DrawingTemplate):
     """轴类零件绘图模板
     
     适用于轴、销等旋转体零件的技术图纸生成
     """
     
-    def _draw_main_view(self, origin: Tuple[float, float] = (0, 0), 
-                       diameter: float = 20, length: float = 100, **kwargs):
-        """绘制轴的主视图（正视图）"""
-        x, y = origin
+    __slots__ = ()
+    
+    def generate_many(self, parts) -> Any:
+        """批量绘制多个轴零件的视图和尺寸标注
         
-        # 绘制轴的外轮廓
-        self.basic_shapes.draw('rectangle', lower_left=(x - length/2, y - diameter/2), 
-                              width=length, height=diameter, layer='PARTS')
+        视图几何由 shaft_layout 一次算出，同类实体一次批量绘制；
+        与逐个调用 generate_drawing 得到相同的实体，但按实体类型而非零件排列
         
-        # 绘制中心线
-        self.basic_shapes.draw('centerline', start=(x - length/2 - 10, y), 
-                              end=(x + length/2 + 10, y))
-    
-    def _draw_auxiliary_views(self, origin: Tuple[float, float] = (0, 0), 
-                            diameter: float = 20, **kwargs):
-        """绘制轴的辅助视图（左视图 - 圆形）"""
-        x, y = origin
+        Args:
+            parts: (N, 4) 数组，每行为 (原点x, 原点y, 直径, 长度)
+            
+        Returns:
+            ezdxf文档对象
+            
+        Raises:
+            ValueError: 当直径或长度不为正数时
+        """
+        parts = np.asarray(parts, dtype=float).reshape(-1, 4)
+        if not (parts[:, 2:] > 0).all():
+            raise ValueError("Invalid shaft parameters: diameters and lengths must be positive")
+        rects, circles, centerlines = shaft_layout(parts)
+        
+        draw = self.basic_shapes.draw_unchecked
+        draw('rectangles', corners=rects)
+        draw('centerlines', segments=centerlines[:, 0].tolist())
+        draw('circles', centers=circles[:, :2], radii=circles[:, 2])
+        draw('centerlines', segments=centerlines[:, 1:].reshape(-1, 2, 2).tolist())
         
-        # 在左侧绘制圆形视图
-        view_x = x - 80
-        self.basic_shapes.draw('circle', center=(view_x, y), radius=diameter/2, layer='PARTS')
+        for x, y, diameter, length in parts.tolist():
+            self._emit(_shaft_dimension_spec(diameter, length), (x, y))
         
-        # 绘制中心线
-        self.basic_shapes.draw('centerline', start=(view_x - diameter/2 - 5, y), 
-                              end=(view_x + diameter/2 + 5, y))
-        self.basic_shapes.draw('centerline', start=(view_x, y - diameter/2 - 5), 
-                              end=(view_x, y + diameter/2 + 5))
+        return self.doc
+    
+    def _parse_params(self, origin: Tuple[float, float] = (0, 0), 
+                      diameter: float = 20, length: float = 100, **kwargs) -> _ShaftParams:
+        """解析轴模板参数"""
+        return _ShaftParams(origin, diameter, length)
+    
+    def _draw_main_view(self, **kwargs):
+        """绘制轴的主视图（正视图）"""
+        params = self._resolve_params(kwargs)
+        self._emit(_shaft_main_spec(params.diameter, params.length), params.origin)
+    
+    def _draw_auxiliary_views(self, **kwargs):
+        """绘制轴的辅助视图（左视图 - 圆形）"""
+        params = self._resolve_params(kwargs)
+        self._emit(_shaft_auxiliary_spec(params.diameter), params.origin)
     
-    def _add_dimensions(self, origin: Tuple[float, float] = (0, 0), 
-                       diameter: float = 20, length: float = 100, **kwargs):
+    def _add_dimensions(self, **kwargs):
         """添加轴的尺寸标注"""
-        x, y = origin
-        
-        # 长度标注
-        self.dimensions.draw('linear', p1=(x - length/2, y - diameter/2), 
-                           p2=(x + length/2, y - diameter/2), distance=15)
-        
-        # 直径标注
-        self.dimensions.draw('diameter', center=(x - 80, y), radius=diameter/2, angle=45)
+        params = self._resolve_params(kwargs)
+        self._emit(_shaft_dimension_spec(params.diameter, params.length), params.origin)
 
 
 class GearTemplate(DrawingTemplate):
@@ -155,44 +349,24 @@ class GearTemplate(DrawingTemplate):
     适用于齿轮等复杂零件的技术图纸生成
     """
     
-    def _draw_main_view(self, origin: Tuple[float, float] = (0, 0), 
-                       outer_diameter: float = 60, inner_diameter: float = 20, **kwargs):
+    __slots__ = ()
+    
+    def _parse_params(self, origin: Tuple[float, float] = (0, 0), outer_diameter: float = 60, 
+                      inner_diameter: float = 20, thickness: float = 15, **kwargs) -> _GearParams:
+        """解析齿轮模板参数"""
+        return _GearParams(origin, outer_diameter, inner_diameter, thickness)
+    
+    def _draw_main_view(self, **kwargs):
         """绘制齿轮的主视图"""
-        x, y = origin
-        
-        # 绘制外圆
-        self.basic_shapes.draw('circle', center=(x, y), radius=outer_diameter/2, layer='PARTS')
-        
-        # 绘制内圆（孔）
-        self.basic_shapes.draw('circle', center=(x, y), radius=inner_diameter/2, layer='PARTS')
-        
-        # 绘制中心线
-        self.basic_shapes.draw('centerline', start=(x - outer_diameter/2 - 10, y), 
-                              end=(x + outer_diameter/2 + 10, y))
-        self.basic_shapes.draw('centerline', start=(x, y - outer_diameter/2 - 10), 
-                              end=(x, y + outer_diameter/2 + 10))
+        params = self._resolve_params(kwargs)
+        self._emit(_gear_main_spec(params.outer_diameter, params.inner_diameter), params.origin)
     
-    def _draw_auxiliary_views(self, origin: Tuple[float, float] = (0, 0), 
-                            thickness: float = 15, outer_diameter: float = 60, **kwargs):
+    def _draw_auxiliary_views(self, **kwargs):
         """绘制齿轮的辅助视图（侧视图）"""
-        x, y = origin
-        
-        # 在右侧绘制侧视图
-        view_x = x + 80
-        self.basic_shapes.draw('rectangle', lower_left=(view_x - thickness/2, y - outer_diameter/2), 
-                              width=thickness, height=outer_diameter, layer='PARTS')
-        
-        # 绘制中心线
-        self.basic_shapes.draw('centerline', start=(view_x, y - outer_diameter/2 - 10), 
-                              end=(view_x, y + outer_diameter/2 + 10))
+        params = self._resolve_params(kwargs)
+        self._emit(_gear_auxiliary_spec(params.thickness, params.outer_diameter), params.origin)
     
-    def _add_dimensions(self, origin: Tuple[float, float] = (0, 0), 
-                       outer_diameter: float = 60, inner_diameter: float = 20, **kwargs):
+    def _add_dimensions(self, **kwargs):
         """添加齿轮的尺寸标注"""
-        x, y = origin
-        
-        # 外径标注
-        self.dimensions.draw('diameter', center=(x, y), radius=outer_diameter/2, angle=45)
-        
-        # 内径标注
-        self.dimensions.draw('diameter', center=(x, y), radius=inner_diameter/2, angle=135) 
\ No newline at end of file
+        params = self._resolve_params(kwargs)
+        self._emit(_gear_dimension_spec(params.outer_diameter, params.inner_diameter), params.origin)
\ No newline at end of file
@@ -1,16 +1,29 @@
+import io
+import itertools
+import logging
 import os
-import sys
 import ezdxf
 import math
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from types import MappingProxyType
 from mechdrawkit.tools.table_methods import update_title_block
+from mechdrawkit.tools.dxf_io import write_dxf, write_dxf_stream
 from mechdrawkit.core.factory import ComponentFactory
 from mechdrawkit.core.adapters import EzdxfAdapter
 from mechdrawkit.config.gb_standards import GBStandardConfig
 
-# 确保当前目录在系统路径中
-current_dir = os.path.dirname(os.path.abspath(__file__))
-if current_dir not in sys.path:
-    sys.path.append(current_dir)
+logger = logging.getLogger(__name__)
+
+# 项目根目录的标识文件
+_ROOT_INDICATORS = frozenset((
+    'setup.py',
+    'pyproject.toml', 
+    'requirements.txt',
+    'Makefile',
+    'mechdrawkit'  # 包目录
+))
 
 def find_project_root(start_path=None):
     """
@@ -25,22 +38,15 @@ def find_project_root(start_path=None):
     if start_path is None:
         start_path = os.path.dirname(os.path.abspath(__file__))
     
-    # 项目根目录的标识文件
-    root_indicators = [
-        'setup.py',
-        'pyproject.toml', 
-        'requirements.txt',
-        'Makefile',
-        'mechdrawkit'  # 包目录
-    ]
-    
     current_path = start_path
     while True:
-        # 检查当前目录是否包含任何标识文件
-        for indicator in root_indicators:
-            indicator_path = os.path.join(current_path, indicator)
-            if os.path.exists(indicator_path):
-                return current_path
+        # 每层目录只列举一次，遇到第一个标识文件即返回，不再收集其余目录项
+        try:
+            with os.scandir(current_path) as entries:
+                if any(entry.name in _ROOT_INDICATORS for entry in entries):
+                    return current_path
+        except OSError:
+            pass
         
         # 移动到父目录
         parent_path = os.path.dirname(current_path)
@@ -55,6 +61,98 @@ def find_project_root(start_path=None):
 # 获取项目根目录
 PROJECT_ROOT = find_project_root()
 
+# 默认模板目录和输出目录
+_TEMPLATES_DIR = os.path.join(PROJECT_ROOT, "templates")
+_OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")
+
+# 本进程内已确认存在的目录，避免每次出图都重复调用makedirs
+_ENSURED_DIRS = set()
+
+def _ensure_dir(path):
+    """确保目录存在，同一目录在进程内只创建/检查一次"""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+# 模板文本缓存：模板路径 -> (文件修改时间, 解码后的DXF文本)，二进制DXF的文本为None
+_TEMPLATE_CACHE = {}
+
+# 二进制DXF文件头
+_BINARY_DXF_SENTINEL = b'AutoCAD Binary DXF'
+
+def _load_template(template_path):
+    """加载模板文件，同一模板只从磁盘读取和解码一次，之后由缓存的文本构建新文档
+    
+    Args:
+        template_path: 模板文件路径
+        
+    Returns:
+        新的DXF文档对象
+    """
+    mtime = os.stat(template_path).st_mtime_ns
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is None or cached[0] != mtime:
+        # 首次加载由 readfile 识别文件编码，再按同一编码缓存文件文本
+        doc = ezdxf.readfile(template_path)
+        with open(template_path, 'rb') as f:
+            is_binary = f.read(len(_BINARY_DXF_SENTINEL)) == _BINARY_DXF_SENTINEL
+        text = None
+        if not is_binary:
+            with open(template_path, encoding=doc.encoding, errors='surrogateescape') as f:
+                text = f.read()
+        _TEMPLATE_CACHE[template_path] = (mtime, text)
+        return doc
+    if cached[1] is None:
+        return ezdxf.readfile(template_path)
+    doc = ezdxf.read(io.StringIO(cached[1]))
+    doc.filename = template_path
+    return doc
+
+# 纸张尺寸（mm）
+_PAPER_SIZES = {
+    'A0': (1189, 841),
+    'A1': (841, 594),
+    'A2': (594, 420),
+    'A3': (420, 297),
+    'A4': (297, 210),
+    'A4_LANDSCAPE': (210, 297)
+}
+
+# 各纸张的默认原点（图纸中心点）
+_PAPER_ORIGINS = {name: (width/2, height/2) for name, (width, height) in _PAPER_SIZES.items()}
+
+# 支持的纸张规格
+_PAPER_KEYS = frozenset(_PAPER_SIZES)
+
+# 度 -> 弧度 换算系数
+_DEG2RAD = math.pi / 180.0
+
+# 绘图工具对象池，按类分别存放已释放的实例，避免批量出图时重复构建适配器和策略对象
+_TOOLS_POOL = {}
+_TOOLS_POOL_MAX = 8
+
+# 声明式图元类型 -> 默认图层，与对应的单个图元绘制方法一致
+_ENTITY_DEFAULT_LAYERS = {
+    'line': 'VISIBLE',
+    'circle': 'PARTS',
+    'polyline': 'PARTS',
+}
+
+class _LazyStrategy:
+    """策略组件懒加载描述符，首次访问时通过工厂创建并写入实例字典，之后直接命中实例属性"""
+    
+    __slots__ = ('name',)
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        strategy = ComponentFactory.create_strategy(self.name, instance.canvas, instance.config)
+        instance.__dict__[self.name] = strategy
+        return strategy
+
 # GB/T 4457.4-2002 技术制图 线型
 # GB/T 14689-2008 机械制图 图样画法视图表示法
 # GB/T 4458.4-2003 技术制图 比例
@@ -69,7 +167,7 @@ class RiceMillDrawingTools:
     
     # 保持原有常量定义以确保向后兼容性
     # GB标准线型定义
-    LINE_TYPES = {
+    LINE_TYPES = MappingProxyType({
         'CONTINUOUS': ('连续线', []),
         'CENTER': ('中心线', [7.5, 5.0, -1.25, 0.0]),
         'HIDDEN': ('虚线', [1.25, -1.25]),
@@ -77,18 +175,18 @@ class RiceMillDrawingTools:
         'DASHDOT': ('点划线', [5.0, -2.0, 0.0, -2.0]),
         'BORDER': ('边界线', [6.0, -2.0, 1.5, -2.0]),
         'DIVIDE': ('分界线', [1.0, -1.0]),
-    }
+    })
     
     # GB标准线宽定义 (mm)
-    LINE_WEIGHTS = {
+    LINE_WEIGHTS = MappingProxyType({
         'THIN': 0.25,     # 细线
         'MEDIUM': 0.5,    # 中等线
         'THICK': 0.7,     # 粗线
         'EXTRA_THICK': 1.0  # 特粗线
-    }
+    })
     
-    # 图层映射字典 - 静态类属性，所有实例共享
-    LAYER_MAPPING = {
+    # 图层映射字典 - 静态类属性，所有实例共享（只读视图）
+    LAYER_MAPPING = MappingProxyType({
         # 基本图层
         'CENTERLINE': '4中心线',        # 中心线使用标准中心线样式
         'HIDDEN': '5虚线',              # 隐藏线使用标准虚线样式
@@ -113,16 +211,16 @@ class RiceMillDrawingTools:
         'AUXILIARY': '9辅助线',         # 辅助线
         'COORDINATE': '10坐标线',       # 坐标线
         'TITLE_BLOCK': '2粗实线',       # 标题栏
-    }
+    })
     
     # GB标准文字高度 (mm)
-    TEXT_HEIGHTS = {
+    TEXT_HEIGHTS = MappingProxyType({
         'TITLE': 5.0,     # 标题
         'SUBTITLE': 3.5,  # 副标题
         'NORMAL': 2.5,    # 常规文字
         'SMALL': 1.8,     # 小文字
         'TINY': 1.4       # 微小文字
-    }
+    })
     
     # 图纸比例
     SCALES = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
@@ -133,6 +231,12 @@ class RiceMillDrawingTools:
     # GB标准字体
     FONT_STYLE = 'chinese'
     
+    # 策略组件，首次使用时才创建
+    basic_shapes = _LazyStrategy()
+    dimensions = _LazyStrategy()
+    symbols = _LazyStrategy()
+    views = _LazyStrategy()
+    
     def __init__(self, msp, doc=None):
         """初始化绘图工具
         
@@ -147,12 +251,6 @@ class RiceMillDrawingTools:
         self.config = GBStandardConfig()
         self.canvas = EzdxfAdapter(msp, doc, self.config)
         
-        # 创建策略组件
-        self.basic_shapes = ComponentFactory.create_strategy('basic_shapes', self.canvas, self.config)
-        self.dimensions = ComponentFactory.create_strategy('dimensions', self.canvas, self.config)
-        self.symbols = ComponentFactory.create_strategy('symbols', self.canvas, self.config)
-        self.views = ComponentFactory.create_strategy('views', self.canvas, self.config)
-        
         # 如果提供了文档对象，确保所需的图层和线型存在（保持原有逻辑）
         if doc:
             self._setup_document(doc)
@@ -162,10 +260,44 @@ class RiceMillDrawingTools:
         # 委托给适配器处理，它已经包含了原有的所有逻辑
         pass  # EzdxfAdapter已经在初始化时处理了文档设置
     
+    @classmethod
+    def acquire(cls, msp, doc=None):
+        """从对象池取出绘图工具实例并绑定到给定模型空间，池为空时新建
+        
+        Args:
+            msp: 模型空间对象
+            doc: DXF文档对象
+            
+        Returns:
+            绑定到 msp/doc 的绘图工具实例，用完后应调用 release 归还
+        """
+        pool = _TOOLS_POOL.get(cls)
+        if not pool:
+            return cls(msp, doc)
+        tools = pool.pop()
+        tools.msp = tools.canvas.msp = msp
+        tools.doc = tools.canvas.doc = doc
+        if doc:
+            tools.canvas._setup_document()
+        return tools
+    
+    @classmethod
+    def release(cls, tools):
+        """解除绘图工具实例与文档的绑定并归还对象池
+        
+        Args:
+            tools: 由 acquire 取得的绘图工具实例
+        """
+        tools.msp = tools.canvas.msp = None
+        tools.doc = tools.canvas.doc = None
+        pool = _TOOLS_POOL.setdefault(type(tools), [])
+        if len(pool) < _TOOLS_POOL_MAX:
+            pool.append(tools)
+    
     # 工具函数 - 角度转换
     def deg2rad(self, degrees):
         """度转弧度"""
-        return degrees * math.pi / 180.0
+        return degrees * _DEG2RAD
     
     # 绘制中心线
     def draw_centerline(self, start, end):
@@ -237,6 +369,73 @@ class RiceMillDrawingTools:
         """
         return self.basic_shapes.draw('polyline', points=points, closed=closed, layer=layer)
     
+    # 批量绘制直线
+    def draw_lines_batch(self, segments, layer='VISIBLE'):
+        """批量绘制直线，图层只解析一次
+        
+        Args:
+            segments: 线段序列 [((x1, y1), (x2, y2)), ...] 或 (N, 4) 数组
+            layer: 图层名称
+        """
+        return self.basic_shapes.draw('lines', segments=segments, layer=layer)
+    
+    # 批量绘制圆
+    def draw_circles_batch(self, centers, radii, layer='PARTS'):
+        """批量绘制圆，图层只解析一次
+        
+        Args:
+            centers: 圆心序列 [(x1, y1), (x2, y2), ...] 或 (N, 2) 数组
+            radii: 半径，标量（所有圆相同）或与圆心一一对应的序列
+            layer: 图层名称
+        """
+        return self.basic_shapes.draw('circles', centers=centers, radii=radii, layer=layer)
+    
+    # 批量绘制多段线
+    def draw_polyline_batch(self, polylines, closed=False, layer='PARTS'):
+        """批量绘制多段线，图层只解析一次
+        
+        Args:
+            polylines: 多段线点列表的序列 [[(x1, y1), (x2, y2), ...], ...]
+            closed: 是否闭合
+            layer: 图层名称
+        """
+        return self.basic_shapes.draw('polylines', polylines=polylines, closed=closed, layer=layer)
+    
+    # 批量绘制声明式图元列表
+    def draw_entities(self, entities):
+        """批量绘制声明式图元列表，同类型、同图层的图元合并为一次批量调用
+        
+        Args:
+            entities: (类型, 参数字典) 序列，支持 'line' (start, end)、'circle' (center, radius)、
+                'polyline' (points, closed)，参数字典中可选 layer
+                
+        Returns:
+            创建的实体列表，按分组顺序排列
+            
+        Raises:
+            ValueError: 当图元类型不支持时
+        """
+        # 按 (类型, 图层, 是否闭合) 分组，保持各组首次出现的顺序
+        groups = {}
+        for kind, params in entities:
+            default_layer = _ENTITY_DEFAULT_LAYERS.get(kind)
+            if default_layer is None:
+                raise ValueError(f"不支持的图元类型: {kind}")
+            key = (kind, params.get('layer', default_layer), params.get('closed', False))
+            groups.setdefault(key, []).append(params)
+        
+        created = []
+        for (kind, layer, closed), items in groups.items():
+            if kind == 'line':
+                created.extend(self.draw_lines_batch([(p['start'], p['end']) for p in items], layer=layer))
+            elif kind == 'circle':
+                created.extend(self.draw_circles_batch([p['center'] for p in items], 
+                                                       [p['radius'] for p in items], layer=layer))
+            else:
+                created.extend(self.draw_polyline_batch([p['points'] for p in items], 
+                                                        closed=closed, layer=layer))
+        return created
+    
     # 绘制样条曲线
     def draw_spline(self, points, degree=3, layer='PARTS'):
         """绘制样条曲线
@@ -338,7 +537,7 @@ class RiceMillDrawingTools:
     
     # 绘制矩形
     def draw_rectangle(self, lower_left, width, height, layer='PARTS'):
-        """绘制矩形"""
+        """绘制矩形，返回单个闭合LWPOLYLINE实体"""
         return self.basic_shapes.draw('rectangle', lower_left=lower_left, width=width, height=height, layer=layer)
     
     # 绘制填充区域
@@ -444,13 +643,149 @@ class RiceMillDrawingTools:
         return self.views.draw('detail_view', center=center, radius=radius,
                               detail_label=detail_label, scale=scale)
 
-def generate_part_drawing(part_name, draw_func, title_info, origin=None, scale_factor=0.5, template_path=None, output_dir=None, paper_size='A3', add_views=None):
+# 可记忆绘制函数的结果缓存：(绘制函数, 零件名, 比例因子, 原点) -> (块名, 实体数据列表)
+# 只保存与文档无关的实体数据，按最近使用顺序保留 _BLOCK_CACHE_MAX 项
+_BLOCK_CACHE = OrderedDict()
+_BLOCK_CACHE_MAX = 64
+_BLOCK_NAMES = itertools.count(1)
+
+# 可由属性重建的实体类型；尺寸标注、样条等依赖文档对象或附加数据的实体不参与缓存
+_PORTABLE_TYPES = frozenset((
+    'LINE', 'CIRCLE', 'ARC', 'ELLIPSE', 'LWPOLYLINE', 'TEXT', 'MTEXT', 'POINT', 'SOLID'
+))
+
+# 不随实体数据缓存的属性：句柄和所属对象由目标文档重新分配
+_DOC_ATTRIBS = frozenset(('handle', 'owner'))
+
+def _detach_entity(entity):
+    """提取重建实体所需的数据，不保留对源文档的引用
+    
+    Args:
+        entity: 可重建类型的DXF实体
+        
+    Returns:
+        tuple: (实体类型, 属性字典, 附加数据)，附加数据为多段线顶点或多行文字内容
+    """
+    dxftype = entity.dxftype()
+    if dxftype == 'LWPOLYLINE':
+        extra = [tuple(map(float, point)) for point in entity.get_points()]
+    elif dxftype == 'MTEXT':
+        extra = entity.text
+    else:
+        extra = None
+    return dxftype, entity.dxfattribs(drop=_DOC_ATTRIBS), extra
+
+def _rebuild_entity(block, data):
+    """在块中按 _detach_entity 提取的数据重建实体"""
+    dxftype, dxfattribs, extra = data
+    entity = block.new_entity(dxftype, dxfattribs)
+    if dxftype == 'LWPOLYLINE':
+        entity.set_points(extra)
+    elif dxftype == 'MTEXT':
+        entity.text = extra
+
+def memoizable(draw_func):
+    """标记绘制函数为纯函数：相同的零件名、原点和比例总是绘制相同的图形
+    
+    generate_part_drawing 会把此类函数的绘制结果放入块中并缓存，
+    再次以相同参数生成时直接复制缓存的实体，不再调用绘制函数
+    
+    Args:
+        draw_func: 绘制零件的函数
+        
+    Returns:
+        标记后的同一函数
+    """
+    draw_func._memoizable = True
+    return draw_func
+
+def _draw_memoized(draw_func, part_name, part_doc, origin, scale_factor):
+    """在新块中绘制可记忆的零件图形，命中缓存时复制缓存的实体
+    
+    Args:
+        draw_func: 由 memoizable 标记的绘制函数
+        part_name: 零件名称
+        part_doc: DXF文档对象
+        origin: 绘图原点坐标
+        scale_factor: 缩放因子
+        
+    Returns:
+        str: 块名称
+    """
+    key = (draw_func, part_name, scale_factor, tuple(origin))
+    cached = _BLOCK_CACHE.get(key)
+    if cached is not None:
+        _BLOCK_CACHE.move_to_end(key)
+        block_name, entities = cached
+        block = part_doc.blocks.new(block_name)
+        for data in entities:
+            _rebuild_entity(block, data)
+        return block_name
+    
+    block_name = f"MDK_PART_{next(_BLOCK_NAMES)}"
+    block = part_doc.blocks.new(block_name)
+    tools = RiceMillDrawingTools.acquire(block, part_doc)
+    try:
+        entities = draw_func(tools, origin, scale=scale_factor)
+        if isinstance(entities, list):
+            tools.draw_entities(entities)
+    finally:
+        RiceMillDrawingTools.release(tools)
+    
+    # 仅当块内实体都可由属性重建时才缓存
+    if all(entity.dxftype() in _PORTABLE_TYPES for entity in block):
+        _BLOCK_CACHE[key] = (block_name, [_detach_entity(entity) for entity in block])
+        if len(_BLOCK_CACHE) > _BLOCK_CACHE_MAX:
+            _BLOCK_CACHE.popitem(last=False)
+    return block_name
+
+def _emit_section_view(tools, view, origin):
+    """添加剖视图标签，提供剖切线位置时同时添加剖切线"""
+    label = view.get('label', 'A-A')
+    position = view.get('position')
+    if position is None:
+        position = (origin[0], origin[1] - 100)
+    tools.add_section_view_label(position, section_label=label)
+    
+    # 如果提供了剖切线位置，添加剖切线
+    section_line = view.get('section_line')
+    if section_line is not None:
+        start = section_line.get('start')
+        if start is None:
+            start = (origin[0] - 50, origin[1] + 50)
+        end = section_line.get('end')
+        if end is None:
+            end = (origin[0] + 50, origin[1] + 50)
+        section_label = label.split('-')[0]  # 从 'A-A' 提取 'A'
+        tools.add_section_line(start, end, section_label=section_label)
+
+def _emit_detail_view(tools, view, origin):
+    """添加局部放大图"""
+    center = view.get('center')
+    if center is None:
+        center = (origin[0] + 80, origin[1] + 80)
+    tools.add_detail_view(center, view.get('radius', 15), 
+                          detail_label=view.get('label', 'B'), scale=view.get('scale', '2:1'))
+
+# 附加视图类型 -> 绘制函数
+_VIEW_DISPATCH = {
+    'section': _emit_section_view,
+    'detail': _emit_detail_view,
+}
+
+# 支持的附加视图类型
+_VIEW_KEYS = frozenset(_VIEW_DISPATCH)
+
+def generate_part_drawing(part_name, draw_func, title_info, origin=None, scale_factor=0.5, template_path=None, output_dir=None, paper_size='A3', add_views=None, binary=False, output=None):
     """
     通用零件图生成函数，可以从任何零件特定脚本调用，符合GB标准
     
     参数:
         part_name (str): 零件名称，用于命名输出文件
-        draw_func (callable): 绘制零件的函数，接受drawing_tools、origin和scale参数
+        draw_func (callable): 绘制零件的函数，接受drawing_tools、origin和scale参数；
+            大量同类图元可通过 drawing_tools.draw_lines_batch / draw_circles_batch / draw_polyline_batch 批量绘制，
+            也可返回 (类型, 参数字典) 列表，由 drawing_tools.draw_entities 按类型和图层分组批量绘制
+            由 memoizable 标记的函数绘制到块中并按 (零件名, 比例, 原点) 缓存，以块参照插入
         title_info (dict): 标题栏信息字典
         origin (tuple, optional): 绘图原点坐标，默认为None (将使用图纸中心点)
         scale_factor (float, optional): 缩放因子，默认为0.5
@@ -458,68 +793,70 @@ def generate_part_drawing(part_name, draw_func, title_info, origin=None, scale_f
         output_dir (str, optional): 输出目录路径，默认为None (将使用标准输出目录)
         paper_size (str, optional): 图纸大小，如 'A4', 'A3', 'A2', 'A1', 'A0'
         add_views (list, optional): 要添加的附加视图列表，格式为 [{'type': 'section', 'label': 'A-A', 'position': (x,y), ...}, ...]
+        binary (bool, optional): 是否保存为二进制DXF（文件更小、写出更快），默认为False
+        output (str or file-like, optional): 输出方式，默认为None (保存到输出目录)；
+            为 'bytes' 时返回DXF字节数据，为可写流时写入该流并返回，均不经过文件系统
     
     返回:
-        str: 生成的DXF文件路径
+        str: 生成的DXF文件路径；指定 output 时为字节数据或传入的流
+    
+    异常:
+        ValueError: 当纸张规格或附加视图类型不支持时
     """
-    # 定义纸张尺寸（mm）
-    paper_sizes = {
-        'A0': (1189, 841),
-        'A1': (841, 594),
-        'A2': (594, 420),
-        'A3': (420, 297),
-        'A4': (297, 210),
-        'A4_LANDSCAPE': (210, 297)
-    }
+    # 开始绘制前检查纸张规格和附加视图类型
+    if paper_size not in _PAPER_KEYS:
+        raise ValueError(f"不支持的纸张规格: {paper_size}，可选: {sorted(_PAPER_KEYS)}")
+    if add_views:
+        for view in add_views:
+            if view.get('type') not in _VIEW_KEYS:
+                raise ValueError(f"不支持的视图类型: {view.get('type')}，可选: {sorted(_VIEW_KEYS)}")
+    
+    # 纸张尺寸
+    current_size = _PAPER_SIZES[paper_size]
     
     # 如果未提供模板路径，使用项目根目录下的templates目录
     if template_path is None:
         template_name = f"{paper_size}_Template.dxf"
-        templates_dir = os.path.join(PROJECT_ROOT, "templates")
+        templates_dir = _TEMPLATES_DIR
         template_path = os.path.join(templates_dir, template_name)
         
         # 确保templates目录存在
-        os.makedirs(templates_dir, exist_ok=True)
-        print(f"模板目录: {templates_dir}")
+        _ensure_dir(templates_dir)
+        logger.info("模板目录: %s", templates_dir)
     
-    # 如果未提供输出目录，使用项目根目录下的output目录
-    if output_dir is None:
-        output_dir = os.path.join(PROJECT_ROOT, "output")
+    # 如果未提供输出目录，使用项目根目录下的output目录（仅在保存到文件时需要）
+    if output is None and output_dir is None:
+        output_dir = _OUTPUT_DIR
         
         # 确保output目录存在
-        os.makedirs(output_dir, exist_ok=True)
-        print(f"输出目录: {output_dir}")
+        _ensure_dir(output_dir)
+        logger.info("输出目录: %s", output_dir)
     
     # 尝试加载模板文件
     try:
-        print(f"尝试加载模板: {template_path}")
-        part_doc = ezdxf.readfile(template_path)
-        print("模板加载成功")
+        logger.info("尝试加载模板: %s", template_path)
+        part_doc = _load_template(template_path)
+        logger.info("模板加载成功")
     except Exception as e:
-        print(f"加载模板失败: {e}")
-        print("尝试创建新的DXF文件...")
+        logger.warning("加载模板失败: %s", e)
+        logger.info("尝试创建新的DXF文件...")
         part_doc = ezdxf.new('R2010')
         
         # 对于新创建的文件，设置合适的界限
-        current_size = paper_sizes.get(paper_size, paper_sizes['A3'])
         part_doc.header['$EXTMIN'] = (0, 0, 0)
         part_doc.header['$EXTMAX'] = (current_size[0], current_size[1], 0)
     
     # 获取模型空间
     msp = part_doc.modelspace()
     
-    # 创建绘图工具实例（使用重构后的版本）
-    drawing_tools = RiceMillDrawingTools(msp, part_doc)
-    
     # 如果未提供原点坐标，使用图纸中心点
     if origin is None:
         # 根据纸张大小设置默认原点
-        current_size = paper_sizes.get(paper_size, paper_sizes['A3'])
-        origin = (current_size[0]/2, current_size[1]/2)  # 图纸中心点
+        origin = _PAPER_ORIGINS[paper_size]
     
     # 计算比例文本
     scale_ratio = 1 / scale_factor
-    scale_ratio_rounded = int(scale_ratio) if scale_ratio == int(scale_ratio) else scale_ratio
+    scale_ratio_rounded = int(scale_ratio) if scale_ratio.is_integer() else scale_ratio
     scale_text = f"1:{scale_ratio_rounded}"
     
     # 确保标题信息中包含比例文本
@@ -528,46 +865,73 @@ def generate_part_drawing(part_name, draw_func, title_info, origin=None, scale_f
     
     # 确保标题信息中包含日期
     if "date" not in title_info:
-        from datetime import datetime
         title_info["date"] = datetime.now().strftime("%Y-%m-%d")
     
-    print(f"  绘制 {part_name}，原点坐标 {origin}，比例因子 {scale_factor}，比例文本 {scale_text}")
-    
-    # 绘制零件
-    draw_func(drawing_tools, origin, scale=scale_factor)
+    logger.info("绘制 %s，原点坐标 %s，比例因子 %s，比例文本 %s", part_name, origin, scale_factor, scale_text)
     
-    # 添加额外视图（如剖视图、局部放大图等）
-    if add_views:
-        for view in add_views:
-            view_type = view.get('type', '')
-            
-            if view_type == 'section':
-                # 添加剖视图标签
-                label = view.get('label', 'A-A')
-                position = view.get('position', (origin[0], origin[1] - 100))
-                drawing_tools.add_section_view_label(position, section_label=label)
-                
-                # 如果提供了剖切线位置，添加剖切线
-                if 'section_line' in view:
-                    start = view['section_line'].get('start', (origin[0] - 50, origin[1] + 50))
-                    end = view['section_line'].get('end', (origin[0] + 50, origin[1] + 50))
-                    section_label = label.split('-')[0]  # 从 'A-A' 提取 'A'
-                    drawing_tools.add_section_line(start, end, section_label=section_label)
-            
-            elif view_type == 'detail':
-                # 添加局部放大图
-                center = view.get('center', (origin[0] + 80, origin[1] + 80))
-                radius = view.get('radius', 15)
-                label = view.get('label', 'B')
-                detail_scale = view.get('scale', '2:1')
-                drawing_tools.add_detail_view(center, radius, detail_label=label, scale=detail_scale)
+    # 从对象池取得绘图工具实例（使用重构后的版本）
+    drawing_tools = RiceMillDrawingTools.acquire(msp, part_doc)
+    try:
+        # 绘制零件：可记忆的绘制函数以块参照插入，返回声明式图元列表时统一批量绘制
+        if getattr(draw_func, '_memoizable', False):
+            block_name = _draw_memoized(draw_func, part_name, part_doc, origin, scale_factor)
+            msp.add_blockref(block_name, (0, 0))
+        else:
+            entities = draw_func(drawing_tools, origin, scale=scale_factor)
+            if isinstance(entities, list):
+                drawing_tools.draw_entities(entities)
+        
+        # 添加额外视图（如剖视图、局部放大图等）
+        if add_views:
+            for view in add_views:
+                _VIEW_DISPATCH[view['type']](drawing_tools, view, origin)
+    finally:
+        RiceMillDrawingTools.release(drawing_tools)
     
     # 更新标题栏
     update_title_block(msp, part_doc, title_info)
     
+    # 直接输出到内存或调用方提供的流，跳过磁盘写入
+    if output == 'bytes':
+        buffer = io.BytesIO()
+        write_dxf_stream(part_doc, buffer, binary=binary)
+        return buffer.getvalue()
+    if output is not None:
+        return write_dxf_stream(part_doc, output, binary=binary)
+    
     # 保存零件图
     output_filename = os.path.join(output_dir, f"{part_name}.dxf")
-    part_doc.saveas(output_filename)
-    print(f"已保存零件图: {output_filename}")
+    write_dxf(part_doc, output_filename, binary=binary)
+    logger.info("已保存零件图: %s", output_filename)
     
-    return output_filename 
\ No newline at end of file
+    return output_filename 
+
+def _generate_part_drawing_job(job):
+    """进程池任务入口，按关键字参数调用 generate_part_drawing"""
+    return generate_part_drawing(**job)
+
+
+def generate_part_drawings_many(jobs, workers=None):
+    """
+    多进程并行生成多张零件图，各零件图互不依赖
+    
+    参数:
+        jobs (list): generate_part_drawing 的关键字参数字典列表；
+            draw_func 须为模块级函数，以便传递到子进程，output 只能为 None 或 'bytes'
+        workers (int, optional): 进程数，默认为None (使用CPU核数)
+    
+    返回:
+        list: 各任务的返回值（DXF文件路径或字节数据），顺序与 jobs 一致
+    
+    异常:
+        ValueError: 任一任务的 output 不为 None 或 'bytes' 时，在启动子进程前抛出
+    """
+    # 子进程写入的是流对象的副本，调用方的流不会收到数据，因此启动前统一检查
+    jobs = list(jobs)
+    for job in jobs:
+        output = job.get('output')
+        if output is not None and output != 'bytes':
+            raise ValueError(f"并行生成只支持 output 为 None 或 'bytes'，收到: {output!r}")
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_part_drawing_job, jobs))
\ No newline at end of file
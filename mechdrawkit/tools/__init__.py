@@ -8,9 +8,13 @@ MechDrawKit Tools Package
 """
 
 from .table_methods import update_title_block, add_parts_table, add_part_to_table
+from .dxf_io import write_dxf, write_dxf_stream, save_all
 
 __all__ = [
     'update_title_block',
     'add_parts_table', 
     'add_part_to_table',
+    'write_dxf',
+    'write_dxf_stream',
+    'save_all',
 ] 
\ No newline at end of file
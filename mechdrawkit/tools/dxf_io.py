@@ -0,0 +1,99 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Write buffer size; fewer write syscalls when serializing large drawings
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_dxf(doc, path, binary=False):
+    """
+    Write a DXF document to disk atomically
+    
+    The document is serialized into a temporary file in the target directory
+    and then renamed over the destination, so readers never see a partially
+    written drawing.
+    
+    Parameters:
+    -----------
+    doc : ezdxf.document.Drawing
+        DXF document object
+    path : str
+        Destination file path
+    binary : bool
+        Write binary DXF instead of ASCII DXF (smaller and faster to write)
+    
+    Returns:
+    --------
+    str
+        The destination path
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        if binary:
+            with open(tmp_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as stream:
+                doc.write(stream, fmt='bin')
+        else:
+            with open(tmp_path, 'wt', buffering=_WRITE_BUFFER_SIZE,
+                      encoding=doc.output_encoding, errors='dxfreplace') as stream:
+                doc.write(stream)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+def write_dxf_stream(doc, stream, binary=False):
+    """
+    Write a DXF document into an open stream
+    
+    Parameters:
+    -----------
+    doc : ezdxf.document.Drawing
+        DXF document object
+    stream : file-like
+        Writable text or binary stream
+    binary : bool
+        Write binary DXF instead of ASCII DXF; requires a binary stream
+    
+    Returns:
+    --------
+    file-like
+        The stream that was written to
+    """
+    if isinstance(stream, io.TextIOBase):
+        if binary:
+            raise ValueError("binary DXF requires a binary stream")
+        doc.write(stream)
+    elif binary:
+        doc.write(stream, fmt='bin')
+    else:
+        wrapper = io.TextIOWrapper(stream, encoding=doc.output_encoding, errors='dxfreplace')
+        doc.write(wrapper)
+        wrapper.flush()
+        # Detach so the caller's stream stays open
+        wrapper.detach()
+    return stream
+
+
+def save_all(pairs, max_workers=4):
+    """
+    Save several DXF documents concurrently
+    
+    Parameters:
+    -----------
+    pairs : iterable of (ezdxf.document.Drawing, str)
+        Documents and their destination paths
+    max_workers : int
+        Number of writer threads
+    
+    Returns:
+    --------
+    list of str
+        The written paths, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda pair: write_dxf(*pair), pairs))
\ No newline at end of file
@@ -1,4 +1,218 @@
-def update_title_block(msp, doc, title_info):
+import itertools
+import logging
+import re
+import sys
+import weakref
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+from ezdxf.entities import Line, Text
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to a compiled regex
+    ahocorasick = None
+
+logger = logging.getLogger(__name__)
+
+
+def _intern_markers(markers):
+    """
+    Intern field names and marker variants so the lookup tables share one
+    string object per marker
+    
+    Parameters:
+    -----------
+    markers : tuple
+        (field, marker variants) pairs
+    
+    Returns:
+    --------
+    tuple
+        The same pairs with interned strings
+    """
+    return tuple(
+        (sys.intern(field), tuple(sys.intern(marker) for marker in variants))
+        for field, variants in markers
+    )
+
+
+# Title block placeholders in match priority order: (field, marker variants).
+# "签名" is not a title_info key; signature cells are resolved by position.
+_TITLE_MARKERS = _intern_markers((
+    ("图样名称", ("图样名称", "(图样名称)", "（图样名称）")),
+    ("图样代号", ("图样代号", "(图样代号)", "（图样代号）")),
+    ("单位名称", ("单位名称", "(单位名称)", "（单位名称）")),
+    ("签名", ("（签名）", "(签名)")),
+    ("日期", ("（年月日）", "(年月日)", "年、月、日")),
+    ("材料", ("材料标记", "(材料标记)", "（材料标记）")),
+    ("标准号", ("标准号",)),
+    ("weight", ("weight",)),
+    ("scale", ("scale",)),
+))
+
+# Default title info if not provided
+_DEFAULT_TITLE_INFO = {
+    "图样名称": "Assembly Drawing",
+    "图样代号": "001",
+    "单位名称": "Organization",
+    "设计": "Designer",
+    "审核": "Reviewer",
+    "标准号": "Standard",
+    "重量": "Weight",
+    "比例": "1:1",
+    "材料": "Assembly",
+    "日期": "Date",
+    "weight": "45kg",    # 符合设计方案中的要求 (≤50kg)
+    "scale": "1:2"     # 适合A0纸上绘制的比例
+}
+
+# Parts table columns and their widths, in the order of a row's values
+_COL_WIDTHS = (
+    ("序号", 8),        # Sequence number column width
+    ("代号", 44),       # Code column width
+    ("名称", 40),       # Name column width
+    ("数量", 8),        # Quantity column width
+    ("材料", 38),       # Material column width
+    ("单件质量", 10),   # Unit weight column width
+    ("总计质量", 12),   # Total weight column width
+    ("备注", 19.5),     # Remarks column width
+)
+_TABLE_COLUMNS = tuple(name for name, _ in _COL_WIDTHS)
+
+# Right edge of each column, measured from the table's left boundary
+_COL_CUM_X = tuple(itertools.accumulate(width for _, width in _COL_WIDTHS))
+
+# Column name -> x-coordinate of the column's text center (from template analysis)
+_COL_X = MappingProxyType({
+    "序号": 1003.0,    # Sequence number column center
+    "代号": 1029.0,    # Code column center
+    "名称": 1071.0,    # Name column center
+    "数量": 1095.0,    # Quantity column center
+    "材料": 1118.0,    # Material column center
+    "单件质量": 1142.0, # Unit weight column center
+    "总计质量": 1153.0, # Total weight column center
+    "备注": 1200.0     # Remarks column center
+})
+
+# Field -> priority
+_FIELD_PRIORITIES = {field: priority for priority, (field, _) in enumerate(_TITLE_MARKERS)}
+
+# title_info keys that have a placeholder; both signature cells share "签名"
+_PLACEHOLDER_FIELDS = frozenset(field for field, _ in _TITLE_MARKERS if field != "签名") | {"设计", "审核"}
+
+
+@lru_cache(maxsize=1)
+def _marker_scanner():
+    """
+    Build the placeholder scanner on first use rather than at import
+    
+    Returns:
+    --------
+    callable
+        Function mapping a text to the (priority, field) values of every
+        placeholder found in it
+    """
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for priority, (field, variants) in enumerate(_TITLE_MARKERS):
+            for marker in variants:
+                automaton.add_word(marker, (priority, field))
+        automaton.make_automaton()
+        
+        def scan(text):
+            return [value for _, value in automaton.iter(text)]
+    else:
+        # One named group per field, so a match names its field directly
+        pattern = re.compile("|".join(
+            f"(?P<{field}>{'|'.join(map(re.escape, variants))})"
+            for field, variants in _TITLE_MARKERS
+        ))
+        
+        def scan(text):
+            return [(_FIELD_PRIORITIES[match.lastgroup], match.lastgroup)
+                    for match in pattern.finditer(text)]
+    return scan
+
+
+@lru_cache(maxsize=512)
+def _match_marker(text):
+    """
+    Find the title block field whose placeholder appears in a text
+    
+    All placeholders are located in a single pass over the text; when
+    several match, the field listed first in _TITLE_MARKERS wins.
+    Results are cached, since templates repeat the same placeholder texts.
+    
+    Parameters:
+    -----------
+    text : str
+        Text content of a TEXT/MTEXT entity
+    
+    Returns:
+    --------
+    str or None
+        Matched field name, or None when no placeholder is found
+    """
+    hits = _marker_scanner()(text)
+    if not hits:
+        return None
+    return min(hits)[1]
+
+
+# Template text style resolved per document
+_TEXT_STYLES = weakref.WeakKeyDictionary()
+
+
+def _text_style(doc):
+    """
+    Resolve the template's text style, checking the document styles once
+    
+    Parameters:
+    -----------
+    doc : ezdxf.document.Drawing
+        DXF document object
+    
+    Returns:
+    --------
+    str
+        '5号字体' when the template defines it, otherwise 'Standard'
+    """
+    style = _TEXT_STYLES.get(doc)
+    if style is None:
+        style = _TEXT_STYLES[doc] = '5号字体' if '5号字体' in doc.styles else 'Standard'
+    return style
+
+
+def _add_line(msp, doc, start, end, dxfattribs):
+    """
+    Construct a LINE entity directly and attach it to the layout
+    
+    Parameters:
+    -----------
+    msp : ezdxf.layouts.BaseLayout
+        Target layout
+    doc : ezdxf.document.Drawing
+        DXF document object
+    start, end : tuple
+        Line end points
+    dxfattribs : dict
+        Shared attributes; copied into the entity, never modified
+    
+    Returns:
+    --------
+    ezdxf.entities.Line
+        The new LINE entity
+    """
+    line = Line.new(dxfattribs=dxfattribs, doc=doc)
+    line.dxf.start = start
+    line.dxf.end = end
+    msp.add_entity(line)
+    return line
+
+
+def update_title_block(msp, doc, title_info, fields=None):
     """
     Update template title block with custom information
     
@@ -20,93 +234,52 @@ def update_title_block(msp, doc, title_info):
         - 比例: Scale
         - 材料: Material
         - 日期: Date
+    fields : iterable of str, optional
+        Only update the placeholders of these title_info keys (for example
+        just the keys the caller overrides); None updates every placeholder
     
     Returns:
     --------
     None
     """
-    # Default title info if not provided
-    default_info = {
-        "图样名称": "Assembly Drawing",
-        "图样代号": "001",
-        "单位名称": "Organization",
-        "设计": "Designer",
-        "审核": "Reviewer",
-        "标准号": "Standard",
-        "重量": "Weight",
-        "比例": "1:1",
-        "材料": "Assembly",
-        "日期": "Date",
-        "weight": "45kg",    # 符合设计方案中的要求 (≤50kg)
-        "scale": "1:2"     # 适合A0纸上绘制的比例
-    }
+    # Nothing to update when none of the requested fields has a placeholder
+    if fields is not None:
+        fields = frozenset(fields)
+        if not fields & _PLACEHOLDER_FIELDS:
+            return
     
-    # Merge provided info with defaults
-    for key, value in default_info.items():
-        if key not in title_info:
-            title_info[key] = value
+    # Merge provided info over the defaults in one step
+    title_info = {**_DEFAULT_TITLE_INFO, **title_info}
     
     # Use template's text style
-    text_style = '5号字体' if '5号字体' in doc.styles else 'Standard'
-    
-    # Iterate through all text entities in model space
-    for entity in msp:
-        if entity.dxftype() in ('TEXT', 'MTEXT'):
-            if hasattr(entity.dxf, 'insert') :
-                if hasattr(entity.dxf, 'text'):
-                    text = entity.dxf.text
-                    pos = entity.dxf.insert
-                    
-                    # Update drawing name
-                    if '图样名称' in text or '(图样名称)' in text or '（图样名称）' in text:
-                        entity.dxf.text = title_info["图样名称"]
-                        entity.dxf.style = text_style
-                    
-                    # Update drawing code
-                    elif '图样代号' in text or '(图样代号)' in text or '（图样代号）' in text:
-                        entity.dxf.text = title_info["图样代号"]
-                        entity.dxf.style = text_style
-                    
-                    # Update organization name
-                    elif '单位名称' in text or '(单位名称)' in text or '（单位名称）' in text:
-                        entity.dxf.text = title_info["单位名称"]
-                        entity.dxf.style = text_style
-                    
-                    # Update signature area
-                    elif '（签名）' in text or '(签名)' in text:
-                        if pos[0] < 1030:  # Designer signature position
-                            entity.dxf.text = title_info["设计"]
-                            entity.dxf.style = text_style
-                        elif pos[0] < 1060:  # Checker signature position
-                            entity.dxf.text = title_info["审核"]
-                            entity.dxf.style = text_style
-                    
-                    # Update date area
-                    elif '（年月日）' in text or '(年月日)' in text or '年、月、日' in text:
-                        entity.dxf.text = title_info["日期"]
-                        entity.dxf.style = text_style
-                    
-                    # Update material mark
-                    elif '材料标记' in text or '(材料标记)' in text or '（材料标记）' in text:
-                        entity.dxf.text = title_info["材料"]
-                        entity.dxf.style = text_style
-                    
-                    # Update standard number
-                    elif '标准号' in text:
-                        entity.dxf.text = title_info["标准号"]
-                        entity.dxf.style = text_style
-                    
-                    # Update weight
-                    elif 'weight' in text:
-                        entity.dxf.text = title_info["weight"]
-                        entity.dxf.style = text_style
-                    
-                    # Update scale
-                    elif 'scale' in text:
-                        entity.dxf.text = title_info["scale"]
-                        entity.dxf.style = text_style
-
-def add_parts_table(msp, doc, parts):
+    text_style = _text_style(doc)
+    
+    # Iterate through the text entities in model space only
+    for entity in msp.query('TEXT MTEXT'):
+        dxf = entity.dxf
+        try:
+            text = dxf.text
+            pos = dxf.insert
+        except AttributeError:
+            continue
+        
+        # Dispatch on the matched placeholder
+        field = _match_marker(text)
+        
+        # Signature cells share one placeholder and are told apart by position
+        if field == "签名":
+            if pos[0] < 1030:  # Designer signature position
+                field = "设计"
+            elif pos[0] < 1060:  # Checker signature position
+                field = "审核"
+            else:
+                field = None
+        
+        if field is not None and (fields is None or field in fields):
+            dxf.text = title_info[field]
+            dxf.style = text_style
+
+def add_parts_table(msp, doc, parts, text_style=None):
     """
     Add parts to the template's parts table
     
@@ -121,6 +294,8 @@ def add_parts_table(msp, doc, parts):
         Each list should contain: [代号, 名称, 数量, 材料, 单件质量, 总计质量, 备注]
         Parts with sequence numbers 1-3 will be placed in template areas
         Parts with sequence numbers >3 will be placed in additional rows
+    text_style : str, optional
+        Text style for the table entries; resolved from the template when None
     
     Returns:
     --------
@@ -131,9 +306,14 @@ def add_parts_table(msp, doc, parts):
         - row_height: height of each row
         - rows: total number of rows
     """
-    # Split parts into template parts (1-3) and additional parts (>3)
-    template_parts = {k: v for k, v in parts.items() if 1 <= k <= 3}
-    additional_parts = {k: v for k, v in parts.items() if k > 3}
+    # Split parts into template parts (1-3) and additional parts (>3) in one pass
+    template_parts = {}
+    additional_parts = {}
+    for k, v in parts.items():
+        if k > 3:
+            additional_parts[k] = v
+        elif k >= 1:
+            template_parts[k] = v
     
     # Existing sequence number positions from template analysis
     existing_seq_y = {
@@ -147,107 +327,71 @@ def add_parts_table(msp, doc, parts):
     row_height = 7.0  # Height per row
     
     # Table's column x-coordinates (from analysis)
-    col_x = {
-        "序号": 1003.0,    # Sequence number column center
-        "代号": 1029.0,    # Code column center
-        "名称": 1071.0,    # Name column center
-        "数量": 1095.0,    # Quantity column center
-        "材料": 1118.0,    # Material column center
-        "单件质量": 1142.0, # Unit weight column center
-        "总计质量": 1153.0, # Total weight column center
-        "备注": 1200.0     # Remarks column center
-    }
+    col_x = _COL_X
     
     # Table title row position
     title_y = existing_seq_y[3] + row_height  # Title row above first data row
     
     # Text height and style settings
     text_height = 3.5  # Based on analysis 
-    text_style = '5号字体' if '5号字体' in doc.styles else 'Standard'  # Use template's text style
-    
-    # Column width definitions for drawing table lines
-    col_widths = {
-        "序号": 8,       # Sequence number column width
-        "代号": 44,      # Code column width
-        "名称": 40,      # Name column width
-        "数量": 8,       # Quantity column width
-        "材料": 38,      # Material column width
-        "单件质量": 10,   # Unit weight column width
-        "总计质量": 12,   # Total weight column width
-        "备注": 19.5     # Remarks column width
-    }
+    if text_style is None:
+        text_style = _text_style(doc)  # Use template's text style
     
     # Table boundary definitions
     table_left = base_x
-    table_right = base_x + sum(col_widths.values())
-    
-    # Process parts for sequence numbers 1-3 (connect with template)
-    print("Adding parts to parts table:")
-    for i in range(1, 4):
-        if i in template_parts:
-            part_info = template_parts[i]
-            y_pos = existing_seq_y[i]  # Use existing y-coordinate in template
-            
-            print(f"  Sequence {i} position: y={y_pos}, Part: {part_info[0]}")
-            
-            # Add part information to all columns
-            add_part_to_table(msp, doc, i, part_info, col_x, y_pos, text_height, text_style)
+    table_right = base_x + _COL_CUM_X[-1]
     
     # Calculate starting position for sequence number 4 and beyond
     start_y = existing_seq_y[3] + row_height
     
-    # Process additional parts starting at position 4
-    for i in range(4, 4 + len(additional_parts)):
-        if i in additional_parts:
-            part_info = additional_parts[i]
-            y_pos = start_y + (i-4) * row_height  # Offset each row
-            
-            print(f"  Sequence {i} position: y={y_pos}, Part: {part_info[0]}")
-            
-            # Add this part to the table
-            add_part_to_table(msp, doc, i, part_info, col_x, y_pos, text_height, text_style)
+    # Parts for sequence numbers 1-3 use the existing template rows; additional
+    # parts follow in sequence order, filling consecutive rows from position 4
+    # even when sequence numbers are not contiguous
+    template_rows = sorted(template_parts.items())
+    rows = template_rows + sorted(additional_parts.items())
+    row_ys = np.empty(len(rows))
+    row_ys[:len(template_rows)] = [existing_seq_y[i] for i, _ in template_rows]
+    row_ys[len(template_rows):] = start_y + np.arange(len(additional_parts)) * row_height
+    
+    # Text positions of every cell, filled by broadcasting column x over row y
+    coords = np.empty((len(rows), len(_TABLE_COLUMNS), 2))
+    coords[:, :, 0] = [col_x[column] for column in _TABLE_COLUMNS]
+    coords[:, :, 1] = row_ys[:, None]
+    
+    logger.info("Adding %d parts to parts table", len(parts))
+    cells = []
+    for (i, part_info), row_coords in zip(rows, coords.tolist()):
+        logger.debug("Sequence %d position: y=%s, Part: %s", i, row_coords[0][1], part_info[0])
+        
+        # Collect part information for all columns
+        cells.extend(_row_cells(i, part_info, row_coords))
+    
+    # Write the texts of all rows in one batch
+    _bulk_add_texts(msp, doc, cells, _cell_attribs(text_height, text_style))
     
     # Get position for lines between rows 3 and 4
     begin_line_y = existing_seq_y[3] + row_height + 26.5
     
-    # Draw table frame - horizontal lines for sequences 4 to max
-    current_y = start_y + 27.5 + 2.5
+    # Frame lines share one attribute set and are built directly as LINE entities
+    frame_attribs = {'layer': '2粗实线'}
+    
+    # Draw table frame - horizontal lines for sequences 4 to max, then the
+    # bottom border of the last row
     max_row = 3 + len(additional_parts) if additional_parts else 16
-    for i in range(4, max_row):
-        # Horizontal divider for each row
-        y_line = current_y + row_height / 2
-        msp.add_line((table_left, y_line), (table_right, y_line), 
-                     dxfattribs={'layer': '2粗实线'})
-        current_y += row_height
-    
-    # Add bottom border for the last row
-    y_line = current_y + row_height / 2
-    msp.add_line((table_left, y_line), (table_right, y_line), 
-                 dxfattribs={'layer': '2粗实线'})
+    first_y = start_y + 27.5 + 2.5 + row_height / 2
+    line_ys = (first_y + np.arange(max(max_row - 4, 0) + 1) * row_height).tolist()
+    for y_line in line_ys:
+        _add_line(msp, doc, (table_left, y_line), (table_right, y_line), frame_attribs)
+    y_line = line_ys[-1]
     
     # Add left frame line - from after sequence 3 to bottom
-    msp.add_line(
-        (table_left, begin_line_y), 
-        (table_left, y_line),  # To bottom of last row
-        dxfattribs={'layer': '2粗实线'}
-    )
-
-    # Draw vertical divider lines - starting after sequence 3
-    x_current = table_left
-    for col_name, width in col_widths.items():
-        # Vertical line position
-        x_line = x_current + width
-        
-        # Skip right border of the last column (already covered by outer frame)
-        if col_name != "备注":
-            # Draw vertical line from below sequence 3 to last row
-            msp.add_line(
-                (x_line, begin_line_y),
-                (x_line, y_line),
-                dxfattribs={'layer': '2粗实线'}
-            )
-        
-        x_current += width
+    _add_line(msp, doc, (table_left, begin_line_y), (table_left, y_line), frame_attribs)
+    
+    # Draw vertical divider lines from below sequence 3 to last row; the right
+    # border of the last column is already covered by the outer frame
+    for cum_x in _COL_CUM_X[:-1]:
+        x_line = table_left + cum_x
+        _add_line(msp, doc, (x_line, begin_line_y), (x_line, y_line), frame_attribs)
     
     # Return table information for further reference
     return {
@@ -284,97 +428,81 @@ def add_part_to_table(msp, doc, seq_num, part_info, col_x, y_pos, text_height, t
     --------
     None
     """
-    # Sequence number
-    msp.add_text(str(seq_num), dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["序号"], y_pos),
-        'halign': 1,  # Center aligned
-        'valign': 1,  # Vertically centered
-        'align_point': (col_x["序号"], y_pos)
-    })
+    row_coords = [(col_x[column], y_pos) for column in _TABLE_COLUMNS]
+    cells = _row_cells(seq_num, part_info, row_coords)
+    _bulk_add_texts(msp, doc, cells, _cell_attribs(text_height, text_style))
+
+
+def _row_cells(seq_num, part_info, row_coords):
+    """
+    Lay out the non-empty cells of one parts table row
+    
+    Parameters:
+    -----------
+    seq_num : int
+        Sequence number for the part
+    part_info : list
+        List containing [代号, 名称, 数量, 材料, 单件质量, 总计质量, 备注]
+    row_coords : sequence
+        (x, y) text position of each column, in _TABLE_COLUMNS order
     
+    Returns:
+    --------
+    list
+        (x, y, text) tuples; empty cells are left out, since they would only
+        add invisible entities
+    """
     # Code - use part_info[0] or generated code if part_info[0] is empty
     code = part_info[0] if part_info[0] else f"P{seq_num:02d}"
-    msp.add_text(code, dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["代号"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["代号"], y_pos)
-    })
-    
-    # Name (truncate if too long)
-    name = part_info[1]
-    if len(name) > 10:  # Prevent name from being too long
-        name = name[:10]
-    msp.add_text(name, dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["名称"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["名称"], y_pos)
-    })
-    
-    # Quantity
-    msp.add_text(part_info[2], dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["数量"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["数量"], y_pos)
-    })
-    
-    # Material (truncate if too long)
-    material = part_info[3]
-    if len(material) > 10:  # Prevent material description from being too long
-        material = material[:10]
-    msp.add_text(material, dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["材料"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["材料"], y_pos)
-    })
-    
-    # Unit weight
-    msp.add_text(part_info[4], dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["单件质量"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["单件质量"], y_pos)
-    })
-    
-    # Total weight
-    msp.add_text(part_info[5], dxfattribs={
-        'height': text_height,
-        'layer': '3文字',
-        'style': text_style,
-        'insert': (col_x["总计质量"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["总计质量"], y_pos)
-    })
-    
-    # Remarks
-    msp.add_text(part_info[6], dxfattribs={
+    
+    # Name and material are truncated to 10 characters so they fit their columns
+    values = (seq_num, code, part_info[1][:10], part_info[2], part_info[3][:10],
+              part_info[4], part_info[5], part_info[6])
+    
+    cells = []
+    for (x, y), value in zip(row_coords, values):
+        text = str(value)
+        if text:
+            cells.append((x, y, text))
+    return cells
+
+
+def _cell_attribs(text_height, text_style):
+    """Return the attributes shared by every parts table text"""
+    return {
         'height': text_height,
         'layer': '3文字',
         'style': text_style,
-        'insert': (col_x["备注"], y_pos),
-        'halign': 1,
-        'valign': 1,
-        'align_point': (col_x["备注"], y_pos)
-    })
\ No newline at end of file
+        'halign': 1,  # Center aligned
+        'valign': 1,  # Vertically centered
+    }
+
+
+def _bulk_add_texts(msp, doc, cells, dxfattribs):
+    """
+    Add many TEXT entities that share everything but position and content
+    
+    The entities are constructed directly and attached to the layout, which
+    skips the per-call argument handling of msp.add_text().
+    
+    Parameters:
+    -----------
+    msp : ezdxf.layouts.ModelSpace
+        Model space object of the drawing
+    doc : ezdxf.document.Drawing
+        DXF document object
+    cells : iterable
+        (x, y, text) tuples, one per entity
+    dxfattribs : dict
+        Attributes shared by all entities; updated in place with the
+        per-entity keys, which Text.new copies into each entity
+    
+    Returns:
+    --------
+    None
+    """
+    add_entity = msp.add_entity
+    for x, y, text in cells:
+        dxfattribs['text'] = text
+        dxfattribs['insert'] = dxfattribs['align_point'] = (x, y)
+        add_entity(Text.new(dxfattribs=dxfattribs, doc=doc))
\ No newline at end of file
@@ -0,0 +1,16 @@
+import pytest
+
+from mechdrawkit.core.adapters import _infer_linetype
+
+
+@pytest.mark.parametrize('logical_layer, mapped_name, linetype', [
+    ('HIDDEN', 'X边界线', 'HIDDEN'),
+    ('VISIBLE', '虚线中心线', 'CENTER'),
+    ('AXIS', '9辅助线', 'CENTER'),
+    ('PHANTOM', '7双点长划线', 'PHANTOM'),
+    ('AUXILIARY', '8边界线', 'BORDER'),
+    ('VISIBLE', '1细实线', 'CONTINUOUS'),
+])
+def test_infer_linetype_priority(logical_layer, mapped_name, linetype):
+    assert _infer_linetype(logical_layer, mapped_name) == linetype
+
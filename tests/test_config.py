@@ -0,0 +1,30 @@
+import json
+
+from mechdrawkit import GBStandardConfig
+from mechdrawkit.config.gb_standards import DEFAULT_CONFIG_FILE
+
+
+def test_config_is_a_shared_instance():
+    config = GBStandardConfig()
+    assert isinstance(config, GBStandardConfig)
+    assert GBStandardConfig() is config
+
+
+def test_later_config_file_is_ignored(tmp_path):
+    config = GBStandardConfig()
+    with open(DEFAULT_CONFIG_FILE, encoding='utf-8') as f:
+        data = json.load(f)
+    data['layer_mapping']['VISIBLE'] = 'NEW_VISIBLE'
+    path = tmp_path / 'gb_standards.json'
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    
+    assert GBStandardConfig(str(path)) is config
+    assert config.get_layer_mapping('VISIBLE') != 'NEW_VISIBLE'
+    
+    version = config.get_version()
+    try:
+        config.reload_config(str(path))
+        assert config.get_layer_mapping('VISIBLE') == 'NEW_VISIBLE'
+        assert config.get_version() != version
+    finally:
+        config.reload_config(DEFAULT_CONFIG_FILE)
@@ -0,0 +1,85 @@
+import json
+
+import ezdxf
+import pytest
+
+from mechdrawkit.config.gb_standards import DEFAULT_CONFIG_FILE, GBStandardConfig
+from mechdrawkit.core.adapters import EzdxfAdapter
+from mechdrawkit.core.factory import ComponentFactory
+from mechdrawkit.core.strategies.basic_shapes import BasicShapeDrawer
+
+
+@pytest.fixture
+def config():
+    """共享配置实例，测试结束后恢复默认配置"""
+    cfg = GBStandardConfig()
+    yield cfg
+    cfg.reload_config(DEFAULT_CONFIG_FILE)
+
+
+@pytest.fixture
+def remapped_config_file(tmp_path):
+    """将 PARTS 和 VISIBLE 映射到新图层的配置文件"""
+    with open(DEFAULT_CONFIG_FILE, encoding='utf-8') as f:
+        data = json.load(f)
+    data['layer_mapping']['PARTS'] = 'NEW_PARTS'
+    data['layer_mapping']['VISIBLE'] = 'NEW_VISIBLE'
+    path = tmp_path / 'gb_standards.json'
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+    return str(path)
+
+
+def test_reload_config_updates_strategy_layers(config, remapped_config_file):
+    doc = ezdxf.new()
+    canvas = EzdxfAdapter(doc.modelspace(), doc, config)
+    shapes = ComponentFactory.create_strategy('basic_shapes', canvas, config)
+    
+    arc = shapes.draw('arc', center=(0, 0), radius=5, start_angle=0, end_angle=90)
+    assert arc.dxf.layer == config.get_layer_mapping('PARTS')
+    
+    config.reload_config(remapped_config_file)
+    assert ComponentFactory.create_strategy('basic_shapes', canvas, config) is shapes
+    
+    arc = shapes.draw('arc', center=(0, 0), radius=5, start_angle=0, end_angle=90)
+    assert arc.dxf.layer == 'NEW_PARTS'
+
+
+def test_reload_config_rebinds_default_layer_fast_paths(config, remapped_config_file):
+    doc = ezdxf.new()
+    canvas = EzdxfAdapter(doc.modelspace(), doc, config)
+    shapes = ComponentFactory.create_strategy('basic_shapes', canvas, config)
+    shapes.draw('line', start=(0, 0), end=(10, 0))
+    
+    config.reload_config(remapped_config_file)
+    
+    line = shapes.draw('line', start=(0, 0), end=(10, 0))
+    assert line.dxf.layer == 'NEW_VISIBLE'
+    circle = shapes.draw_unchecked('circle', center=(0, 0), radius=5)
+    assert circle.dxf.layer == 'NEW_PARTS'
+
+
+def test_draw_uses_overridden_validate_params(config):
+    class StrictShapes(BasicShapeDrawer):
+        def validate_params(self, operation, **kwargs):
+            if operation == 'circle' and kwargs['radius'] > 100:
+                return False
+            return super().validate_params(operation, **kwargs)
+    
+    doc = ezdxf.new()
+    shapes = StrictShapes(EzdxfAdapter(doc.modelspace(), doc, config), config)
+    shapes.draw('circle', center=(0, 0), radius=5)
+    with pytest.raises(ValueError):
+        shapes.draw('circle', center=(0, 0), radius=500)
+
+
+def test_section_lines_reject_mismatched_labels(config):
+    doc = ezdxf.new()
+    views = ComponentFactory.create_strategy('views', EzdxfAdapter(doc.modelspace(), doc, config), config)
+    starts = [(0, 0), (0, 20), (0, 40)]
+    ends = [(50, 0), (50, 20), (50, 40)]
+    with pytest.raises(ValueError):
+        views.draw('section_lines', starts=starts, ends=ends, labels=['A'])
+    assert len(doc.modelspace()) == 0
+    
+    views.draw('section_lines', starts=starts, ends=ends, labels=['A', 'B', 'C'])
+    assert len(doc.modelspace()) == 21
@@ -0,0 +1,43 @@
+import ezdxf
+import pytest
+
+from mechdrawkit import DrawingTemplate, ShaftTemplate
+
+
+def _new_doc():
+    doc = ezdxf.new()
+    return doc, doc.modelspace()
+
+
+def test_keyword_hook_subclass_of_base_template():
+    class PlateTemplate(DrawingTemplate):
+        def _draw_main_view(self, origin=(0, 0), size=10, **kwargs):
+            self.basic_shapes.draw('circle', center=origin, radius=size)
+        
+        def _draw_auxiliary_views(self, **kwargs):
+            pass
+    
+    doc, msp = _new_doc()
+    PlateTemplate(msp, doc).generate_drawing(origin=(5, 5), size=3)
+    circle, = msp.query('CIRCLE')
+    assert tuple(circle.dxf.center)[:2] == (5, 5)
+    assert circle.dxf.radius == 3
+
+
+def test_keyword_hook_override_of_shaft_template():
+    class OffsetShaftTemplate(ShaftTemplate):
+        def _draw_main_view(self, origin=(0, 0), diameter=20, length=100, **kwargs):
+            super()._draw_main_view(origin=origin, diameter=diameter * 2, length=length, **kwargs)
+    
+    doc, msp = _new_doc()
+    OffsetShaftTemplate(msp, doc).generate_drawing(origin=(0, 0), diameter=10, length=50)
+    outline, = msp.query('LWPOLYLINE')
+    ys = [y for x, y in outline.get_points('xy')]
+    assert max(ys) - min(ys) == 20
+
+
+def test_invalid_shaft_parameters_raise():
+    doc, msp = _new_doc()
+    with pytest.raises(ValueError):
+        ShaftTemplate(msp, doc).generate_drawing(diameter=-1)
+    assert len(msp) == 0